@@ -10,17 +10,22 @@
 #
 # Build: pyinstaller --noconsole --onefile --name "GrafTrail-v1.5.3" app.py
 
-import sys, time, os, ctypes, math, threading
+import sys, time, os, ctypes, math, functools, random
 from dataclasses import dataclass, field
 from typing import List, Optional, Tuple
 from pathlib import Path
 from enum import Enum
 
-import pyautogui
 from PyQt5 import QtCore, QtGui, QtWidgets
 import platform   # Platform detection for cross-platform compatibility
 
-pyautogui.FAILSAFE = False
+# RNG/trig functions bound once for the particle code, which calls them per particle
+_uniform = random.uniform
+_randint = random.randint
+_random  = random.random
+_cos     = math.cos
+_sin     = math.sin
+_TWO_PI  = 2 * math.pi
 
 APP_NAME    = "GrafTrail"
 APP_VERSION = "1.5.3"      # Keyboard shortcuts (Alt+1-4) for draw modes
@@ -34,9 +39,14 @@ class DrawMode(Enum):
     ARROW = "arrow"
 
 # ------------------------- Cross-platform helpers -------------------------
+# Evaluated once at import; the platform can't change while we run
+_PLATFORM   = platform.system().lower()
+_IS_WINDOWS = _PLATFORM == "windows"
+_IS_MACOS   = _PLATFORM == "darwin"
+
 def get_platform() -> str:
     """Get the current platform name in lowercase."""
-    return platform.system().lower()
+    return _PLATFORM
 
 # Windows system metrics constants for multi-monitor setups
 SM_XVIRTUALSCREEN  = 76
@@ -55,11 +65,144 @@ VK_2 = 0x32        # Number 2 key
 VK_3 = 0x33        # Number 3 key
 VK_4 = 0x34        # Number 4 key
 
+# Alt+<key> shortcuts and the draw mode each one selects
+_DRAW_MODE_KEYS = ((VK_1, DrawMode.FREEHAND), (VK_2, DrawMode.RECTANGLE),
+                   (VK_3, DrawMode.CIRCLE), (VK_4, DrawMode.ARROW))
+
+# Bind user32 queries once with explicit signatures (no per-call argument inspection)
+if _IS_WINDOWS:
+    _GetAsyncKeyState = ctypes.windll.user32.GetAsyncKeyState
+    _GetAsyncKeyState.argtypes = [ctypes.c_int]
+    _GetAsyncKeyState.restype = ctypes.c_short  # high bit set (key down) -> negative
+    _GetKeyState = ctypes.windll.user32.GetKeyState
+    _GetKeyState.argtypes = [ctypes.c_int]
+    _GetKeyState.restype = ctypes.c_short  # low bit set -> toggle key (Caps Lock) is on
+    _GetSystemMetrics = ctypes.windll.user32.GetSystemMetrics
+    _GetSystemMetrics.argtypes = [ctypes.c_int]
+    _GetSystemMetrics.restype = ctypes.c_int
+
 # Platform-specific global state for CTRL and SHIFT key tracking
 _ctrl_pressed = False
 _shift_pressed = False
+_caps_on = False  # Caps Lock toggle state, kept by the key monitor/hook (Windows)
 _key_monitor = None
 
+# Low-level keyboard hook (Windows): key state arrives as events instead of being polled
+WH_KEYBOARD_LL = 13
+HC_ACTION      = 0
+WM_KEYDOWN     = 0x0100
+WM_KEYUP       = 0x0101
+WM_SYSKEYDOWN  = 0x0104  # key pressed while ALT is held
+WM_SYSKEYUP    = 0x0105
+_HOOK_VKS = frozenset((VK_LCONTROL, VK_RCONTROL, VK_LSHIFT, VK_RSHIFT, VK_LALT, VK_RALT, VK_CAPITAL,
+                       *(vk for vk, _ in _DRAW_MODE_KEYS)))
+
+HOOK_RESYNC_MS = 250  # how often held keys are checked against GetAsyncKeyState while hooked
+WM_WTSSESSION_CHANGE    = 0x02B1
+WTS_SESSION_UNLOCK      = 0x8
+NOTIFY_FOR_THIS_SESSION = 0
+
+_keyboard_hook = None
+_keys_down = set()  # tracked VK codes currently held, per the hook
+
+if _IS_WINDOWS:
+    from ctypes import wintypes
+
+    class KBDLLHOOKSTRUCT(ctypes.Structure):
+        _fields_ = [("vkCode", wintypes.DWORD), ("scanCode", wintypes.DWORD),
+                    ("flags", wintypes.DWORD), ("time", wintypes.DWORD),
+                    ("dwExtraInfo", ctypes.c_size_t)]
+
+    HOOKPROC = ctypes.WINFUNCTYPE(wintypes.LPARAM, ctypes.c_int, wintypes.WPARAM, wintypes.LPARAM)
+
+    _SetWindowsHookExW = ctypes.windll.user32.SetWindowsHookExW
+    _SetWindowsHookExW.argtypes = [ctypes.c_int, HOOKPROC, wintypes.HINSTANCE, wintypes.DWORD]
+    _SetWindowsHookExW.restype = wintypes.HHOOK
+    _CallNextHookEx = ctypes.windll.user32.CallNextHookEx
+    _CallNextHookEx.argtypes = [wintypes.HHOOK, ctypes.c_int, wintypes.WPARAM, wintypes.LPARAM]
+    _CallNextHookEx.restype = wintypes.LPARAM
+    _UnhookWindowsHookEx = ctypes.windll.user32.UnhookWindowsHookEx
+    _UnhookWindowsHookEx.argtypes = [wintypes.HHOOK]
+    _UnhookWindowsHookEx.restype = wintypes.BOOL
+    _GetModuleHandleW = ctypes.windll.kernel32.GetModuleHandleW
+    _GetModuleHandleW.argtypes = [wintypes.LPCWSTR]
+    _GetModuleHandleW.restype = wintypes.HMODULE
+    _WTSRegisterSessionNotification = ctypes.windll.wtsapi32.WTSRegisterSessionNotification
+    _WTSRegisterSessionNotification.argtypes = [wintypes.HWND, wintypes.DWORD]
+    _WTSRegisterSessionNotification.restype = wintypes.BOOL
+
+    def _keyboard_hook_proc(n_code, w_param, l_param):
+        """Update modifier state and catch Alt+1-4 on key events.
+
+        Runs on the GUI thread (the one that installed the hook) while Qt pumps
+        messages, so it must return quickly; mode changes are posted, not run here.
+        """
+        global _ctrl_pressed, _shift_pressed, _caps_on
+        if n_code == HC_ACTION:
+            vk = ctypes.cast(l_param, ctypes.POINTER(KBDLLHOOKSTRUCT))[0].vkCode
+            if vk in _HOOK_VKS:
+                if w_param == WM_KEYDOWN or w_param == WM_SYSKEYDOWN:
+                    if vk not in _keys_down:  # ignore auto-repeat
+                        _keys_down.add(vk)
+                        if vk == VK_CAPITAL:
+                            _caps_on = not _caps_on  # hook runs before the toggle is applied
+                        if _key_monitor and (VK_LALT in _keys_down or VK_RALT in _keys_down):
+                            _key_monitor.post_shortcut(vk)
+                elif w_param == WM_KEYUP or w_param == WM_SYSKEYUP:
+                    _keys_down.discard(vk)
+                _ctrl_pressed = VK_LCONTROL in _keys_down or VK_RCONTROL in _keys_down
+                _shift_pressed = VK_LSHIFT in _keys_down or VK_RSHIFT in _keys_down
+        return _CallNextHookEx(None, n_code, w_param, l_param)
+
+    _keyboard_hook_proc_ptr = HOOKPROC(_keyboard_hook_proc)  # keep the callback alive
+
+def _install_keyboard_hook() -> bool:
+    """Install the WH_KEYBOARD_LL hook (Windows). False means keep polling."""
+    global _keyboard_hook, _caps_on
+    if _keyboard_hook:
+        return True
+    try:
+        # Seed state in case keys are already held when the hook goes in
+        _keys_down.clear()
+        _keys_down.update(vk for vk in _HOOK_VKS if _GetAsyncKeyState(vk) < 0)
+        _caps_on = bool(_GetKeyState(VK_CAPITAL) & 1)
+        _keyboard_hook = _SetWindowsHookExW(WH_KEYBOARD_LL, _keyboard_hook_proc_ptr,
+                                            _GetModuleHandleW(None), 0)
+    except Exception:
+        _keyboard_hook = None
+    return bool(_keyboard_hook)
+
+def _remove_keyboard_hook():
+    global _keyboard_hook
+    if _keyboard_hook:
+        _UnhookWindowsHookEx(_keyboard_hook)
+        _keyboard_hook = None
+
+def _resync_hook_keys(*_):
+    """Rebuild the hook's held keys from GetAsyncKeyState.
+
+    The hook never sees key-ups that happen on the secure desktop (Ctrl+Alt+Del,
+    Win+L, UAC) or after Windows has timed it out, which would leave CTRL, SHIFT
+    or Alt stuck down. Runs on the GUI thread, so it can't interleave with the hook.
+    """
+    global _ctrl_pressed, _shift_pressed
+    if not _keyboard_hook:
+        return
+    gaks = _GetAsyncKeyState
+    held = {vk for vk in _HOOK_VKS if gaks(vk) < 0}
+    if held != _keys_down:
+        _keys_down.clear(); _keys_down.update(held)
+        _ctrl_pressed = VK_LCONTROL in held or VK_RCONTROL in held
+        _shift_pressed = VK_LSHIFT in held or VK_RSHIFT in held
+
+def _watch_session_unlock(widget: QtWidgets.QWidget):
+    """Have Windows send session lock/unlock notices to widget (see Overlay.nativeEvent)."""
+    if _keyboard_hook:
+        try:
+            _WTSRegisterSessionNotification(int(widget.winId()), NOTIFY_FOR_THIS_SESSION)
+        except Exception:
+            pass
+
 class GlobalKeyMonitor(QtCore.QObject):
     """Cross-platform global key state monitor using Qt events."""
     draw_mode_changed = QtCore.pyqtSignal(DrawMode)  # Signal for draw mode changes
@@ -67,106 +210,117 @@ class GlobalKeyMonitor(QtCore.QObject):
     def __init__(self):
         super().__init__()
         self.timer = QtCore.QTimer()
-        self.timer.timeout.connect(self.check_keys)
-        self.timer.start(16)  # Check every 16ms (~60 FPS) for more responsive key detection
         
         # Track previous key states to detect key press events (not just held keys)
-        self._prev_alt_1 = False
-        self._prev_alt_2 = False
-        self._prev_alt_3 = False
-        self._prev_alt_4 = False
+        self._prev_alt_keys = (False,) * len(_DRAW_MODE_KEYS)
+        
+        # Pick the modifier reader for this platform once instead of branching every poll
+        if _IS_WINDOWS:
+            self._read_modifiers = self._read_modifiers_windows
+        elif _IS_MACOS:
+            self._read_modifiers = self._read_modifiers_macos
+        else:
+            self._read_modifiers = self._read_modifiers_linux
+        
+        if _IS_WINDOWS and _install_keyboard_hook():
+            # Key events come from the hook; only check now and then for key-ups it missed
+            app = QtWidgets.QApplication.instance()
+            app.aboutToQuit.connect(_remove_keyboard_hook)
+            app.applicationStateChanged.connect(_resync_hook_keys)
+            self.timer.timeout.connect(_resync_hook_keys)
+            self.timer.start(HOOK_RESYNC_MS)
+        else:
+            self.timer.timeout.connect(self.check_keys)
+            self.timer.start(16)  # Check every 16ms (~60 FPS) for more responsive key detection
+
+    def post_shortcut(self, vk: int):
+        """Emit the draw mode for an Alt+<vk> press, outside the keyboard hook."""
+        for key, mode in _DRAW_MODE_KEYS:
+            if key == vk:
+                QtCore.QTimer.singleShot(0, lambda m=mode: self.draw_mode_changed.emit(m))
+                break
 
     def check_keys(self):
-        global _ctrl_pressed, _shift_pressed
-        current_platform = get_platform()
+        self._read_modifiers()
         
-        if current_platform == "windows":
+        # Check for Alt+1-4 key combinations to change draw modes
+        self._check_draw_mode_shortcuts()
+    
+    def _read_modifiers_windows(self):
+        global _ctrl_pressed, _shift_pressed, _caps_on
+        try:
+            gaks = _GetAsyncKeyState
+            _ctrl_pressed = gaks(VK_LCONTROL) < 0 or gaks(VK_RCONTROL) < 0
+            _shift_pressed = gaks(VK_LSHIFT) < 0 or gaks(VK_RSHIFT) < 0
+            _caps_on = bool(_GetKeyState(VK_CAPITAL) & 1)
+        except:
+            pass
+    
+    def _read_modifiers_macos(self):
+        global _ctrl_pressed, _shift_pressed
+        try:
+            # Try to use pyobjc for global key detection
+            import objc
+            from Cocoa import NSEvent
+            # Get current event modifier flags - this works globally without focus
+            flags = NSEvent.modifierFlags()
+            # Check for CMD key (⌘) and Shift key using proper constants
+            _ctrl_pressed = bool(flags & 0x100000)  # NSEventModifierFlagCommand
+            _shift_pressed = bool(flags & 0x020000)  # NSEventModifierFlagShift
+        except (ImportError, AttributeError):
+            # Fallback: Use Qt with a more robust approach
             try:
-                _ctrl_pressed = (ctypes.windll.user32.GetAsyncKeyState(VK_LCONTROL) & 0x8000) or \
-                               (ctypes.windll.user32.GetAsyncKeyState(VK_RCONTROL) & 0x8000)
-                _shift_pressed = (ctypes.windll.user32.GetAsyncKeyState(VK_LSHIFT) & 0x8000) or \
-                                (ctypes.windll.user32.GetAsyncKeyState(VK_RSHIFT) & 0x8000)
+                app = QtWidgets.QApplication.instance()
+                if app:
+                    modifiers = app.queryKeyboardModifiers()  # Use queryKeyboardModifiers for global state
+                    _ctrl_pressed = bool(modifiers & QtCore.Qt.MetaModifier)  # CMD key on Mac
+                    _shift_pressed = bool(modifiers & QtCore.Qt.ShiftModifier)
             except:
-                pass
-        elif current_platform == "darwin":  # macOS
-            try:
-                # Try to use pyobjc for global key detection
-                import objc
-                from Cocoa import NSEvent
-                # Get current event modifier flags - this works globally without focus
-                flags = NSEvent.modifierFlags()
-                # Check for CMD key (⌘) and Shift key using proper constants
-                _ctrl_pressed = bool(flags & 0x100000)  # NSEventModifierFlagCommand
-                _shift_pressed = bool(flags & 0x020000)  # NSEventModifierFlagShift
-            except (ImportError, AttributeError):
-                # Fallback: Use Qt with a more robust approach
+                # Last resort: check if any windows have focus and use their modifiers
                 try:
                     app = QtWidgets.QApplication.instance()
                     if app:
-                        modifiers = app.queryKeyboardModifiers()  # Use queryKeyboardModifiers for global state
-                        _ctrl_pressed = bool(modifiers & QtCore.Qt.MetaModifier)  # CMD key on Mac
+                        # Check if we can get global modifier state
+                        modifiers = QtWidgets.QApplication.keyboardModifiers()
+                        _ctrl_pressed = bool(modifiers & QtCore.Qt.MetaModifier)  # CMD key
                         _shift_pressed = bool(modifiers & QtCore.Qt.ShiftModifier)
                 except:
-                    # Last resort: check if any windows have focus and use their modifiers
-                    try:
-                        app = QtWidgets.QApplication.instance()
-                        if app:
-                            # Check if we can get global modifier state
-                            modifiers = QtWidgets.QApplication.keyboardModifiers()
-                            _ctrl_pressed = bool(modifiers & QtCore.Qt.MetaModifier)  # CMD key
-                            _shift_pressed = bool(modifiers & QtCore.Qt.ShiftModifier)
-                    except:
-                        pass
-        else:  # Linux
-            try:
-                # Use Qt to check for CTRL key on Linux
-                app = QtWidgets.QApplication.instance()
-                if app:
-                    modifiers = app.keyboardModifiers()
-                    _ctrl_pressed = bool(modifiers & QtCore.Qt.ControlModifier)
-                    _shift_pressed = bool(modifiers & QtCore.Qt.ShiftModifier)
-            except:
-                pass
-        
-        # Check for Alt+1-4 key combinations to change draw modes
-        self._check_draw_mode_shortcuts(current_platform)
+                    pass
     
-    def _check_draw_mode_shortcuts(self, current_platform: str):
+    def _read_modifiers_linux(self):
+        global _ctrl_pressed, _shift_pressed
+        try:
+            # Use Qt to check for CTRL key on Linux
+            app = QtWidgets.QApplication.instance()
+            if app:
+                modifiers = app.keyboardModifiers()
+                _ctrl_pressed = bool(modifiers & QtCore.Qt.ControlModifier)
+                _shift_pressed = bool(modifiers & QtCore.Qt.ShiftModifier)
+        except:
+            pass
+    
+    def _check_draw_mode_shortcuts(self):
         """Check for Alt+1-4 shortcuts and emit draw mode changes."""
-        if current_platform == "windows":
+        if _IS_WINDOWS:
             try:
-                # Check if Alt is pressed
-                alt_pressed = (ctypes.windll.user32.GetAsyncKeyState(VK_LALT) & 0x8000) or \
-                             (ctypes.windll.user32.GetAsyncKeyState(VK_RALT) & 0x8000)
-                
-                if alt_pressed:
-                    # Check for number keys 1-4
-                    alt_1 = bool(ctypes.windll.user32.GetAsyncKeyState(VK_1) & 0x8000)
-                    alt_2 = bool(ctypes.windll.user32.GetAsyncKeyState(VK_2) & 0x8000)
-                    alt_3 = bool(ctypes.windll.user32.GetAsyncKeyState(VK_3) & 0x8000)
-                    alt_4 = bool(ctypes.windll.user32.GetAsyncKeyState(VK_4) & 0x8000)
-                    
-                    # Detect key press events (not just held keys)
-                    if alt_1 and not self._prev_alt_1:
-                        self.draw_mode_changed.emit(DrawMode.FREEHAND)
-                    elif alt_2 and not self._prev_alt_2:
-                        self.draw_mode_changed.emit(DrawMode.RECTANGLE)
-                    elif alt_3 and not self._prev_alt_3:
-                        self.draw_mode_changed.emit(DrawMode.CIRCLE)
-                    elif alt_4 and not self._prev_alt_4:
-                        self.draw_mode_changed.emit(DrawMode.ARROW)
-                    
-                    # Update previous states
-                    self._prev_alt_1 = alt_1
-                    self._prev_alt_2 = alt_2
-                    self._prev_alt_3 = alt_3
-                    self._prev_alt_4 = alt_4
-                else:
+                gaks = _GetAsyncKeyState
+                # Check if Alt is pressed; skip the number keys entirely when it isn't
+                if not (gaks(VK_LALT) < 0 or gaks(VK_RALT) < 0):
                     # Reset previous states when Alt is not pressed
-                    self._prev_alt_1 = False
-                    self._prev_alt_2 = False
-                    self._prev_alt_3 = False
-                    self._prev_alt_4 = False
+                    self._prev_alt_keys = (False,) * len(_DRAW_MODE_KEYS)
+                    return
+                
+                # Check for number keys 1-4
+                keys = tuple(gaks(vk) < 0 for vk, _ in _DRAW_MODE_KEYS)
+                
+                # Detect key press events (not just held keys); first new press wins
+                for (_, mode), down, was_down in zip(_DRAW_MODE_KEYS, keys, self._prev_alt_keys):
+                    if down and not was_down:
+                        self.draw_mode_changed.emit(mode)
+                        break
+                
+                # Update previous states
+                self._prev_alt_keys = keys
             except:
                 pass
         else:
@@ -203,27 +357,53 @@ def shift_down() -> bool:
     return _shift_pressed
 
 def caps_lock_on() -> bool:
-    current_platform = get_platform()
-    if current_platform == "windows":
-        try:
-            return bool(ctypes.windll.user32.GetKeyState(VK_CAPITAL) & 1)
-        except:
-            return False
-    return False
+    return _caps_on  # Always False off Windows
+
+def cursor_pos() -> Tuple[int, int]:
+    """Global mouse position in screen coordinates."""
+    p = QtGui.QCursor.pos()
+    return p.x(), p.y()
+
+_vrect_cache: Optional[QtCore.QRect] = None  # Cleared when screens change (see _watch_screen_changes)
 
 def virtual_rect() -> QtCore.QRect:
-    current_platform = get_platform()
-    if current_platform == "windows":
+    """Virtual desktop rectangle, cached until the display configuration changes."""
+    global _vrect_cache
+    if _vrect_cache is None:
+        _vrect_cache = _query_virtual_rect()
+    return QtCore.QRect(_vrect_cache)
+
+def _query_virtual_rect() -> QtCore.QRect:
+    if _IS_WINDOWS:
         try:
-            left = ctypes.windll.user32.GetSystemMetrics(SM_XVIRTUALSCREEN)
-            top = ctypes.windll.user32.GetSystemMetrics(SM_YVIRTUALSCREEN)
-            width = ctypes.windll.user32.GetSystemMetrics(SM_CXVIRTUALSCREEN)
-            height = ctypes.windll.user32.GetSystemMetrics(SM_CYVIRTUALSCREEN)
+            left = _GetSystemMetrics(SM_XVIRTUALSCREEN)
+            top = _GetSystemMetrics(SM_YVIRTUALSCREEN)
+            width = _GetSystemMetrics(SM_CXVIRTUALSCREEN)
+            height = _GetSystemMetrics(SM_CYVIRTUALSCREEN)
             return QtCore.QRect(left, top, width, height)
         except:
             pass
     return QtWidgets.QApplication.desktop().screenGeometry()
 
+def _invalidate_virtual_rect(*_):
+    global _vrect_cache
+    _vrect_cache = None
+
+def _watch_screen_changes(app: QtWidgets.QApplication, on_change=None):
+    """Drop the cached virtual rect when a monitor is added, removed, moved or resized,
+    then call on_change (e.g. to resize the overlay)."""
+    def changed(*_):
+        _invalidate_virtual_rect()
+        if on_change is not None:
+            on_change()
+    def watch(screen: QtGui.QScreen):
+        screen.geometryChanged.connect(changed)
+    app.screenAdded.connect(watch)
+    app.screenAdded.connect(changed)
+    app.screenRemoved.connect(changed)
+    for screen in app.screens():
+        watch(screen)
+
 def asset_path(*parts):
     if getattr(sys, 'frozen', False):
         base_dir = sys._MEIPASS
@@ -313,6 +493,37 @@ def is_run_at_startup():
         return False
 
 # ------------------------- Config model -------------------------
+# Start/mid/end RGB for the fixed color schemes (4 = rainbow uses rainbow_1..7)
+_SCHEME_COLORS = {
+    1: ((0, 255, 255), (0, 255, 255), (0, 255, 255)),    # Cyan
+    2: ((255, 140, 0), (255, 200, 0), (255, 255, 0)),    # Burnt Orange -> (interpolated) -> Yellow
+    3: ((170, 0, 255), (255, 140, 0), (255, 255, 0)),    # Purple -> Burnt Orange -> Yellow
+}
+
+GRADIENT_LUT_SIZE = 256  # Precomputed trail colors across life 0..1
+
+@functools.lru_cache(maxsize=128)
+def _parse_hex(txt: str) -> Optional[Tuple[int, int, int]]:
+    """Parse a saved color string to RGB, or None if it isn't a valid color."""
+    if len(txt) == 7 and txt[0] == "#":
+        try:
+            return int(txt[1:3], 16), int(txt[3:5], 16), int(txt[5:7], 16)
+        except ValueError:
+            return None
+    c = QtGui.QColor(txt)  # Named colors and other formats Qt understands
+    return (c.red(), c.green(), c.blue()) if c.isValid() else None
+
+def _to_bool(v) -> bool:
+    """Stored booleans come back as "true"/"false" strings from INI/registry settings."""
+    if isinstance(v, str):
+        return v.lower() in ("true", "1")
+    return bool(v)
+
+@functools.lru_cache(maxsize=128)
+def _rgb_to_hex(rgb: int) -> str:
+    """Format a 0xRRGGBB value as "#RRGGBB"."""
+    return "#{:06X}".format(rgb & 0xFFFFFF)
+
 @dataclass
 class Config:
     color_start: QtGui.QColor = field(default_factory=lambda: QtGui.QColor(170, 0, 255))    # Purple
@@ -340,15 +551,16 @@ class Config:
     explosion_intensity: float = 1.0  # Explosion intensity multiplier (0.1 = light, 3.0 = massive)
     comet_enabled: bool = True  # Enable/disable comet tails
     draw_mode: DrawMode = DrawMode.FREEHAND  # Drawing mode (freehand, rectangle, circle)
+    _saved: dict = field(default_factory=dict, repr=False, compare=False)  # Values last read from/written to settings
 
     @staticmethod
     def _qcolor_to_hex(c: QtGui.QColor) -> str:
-        return "#{:02X}{:02X}{:02X}".format(c.red(), c.green(), c.blue())
+        return _rgb_to_hex(c.rgb())  # QColor isn't hashable, its packed rgb is
 
     @staticmethod
     def _hex_to_qcolor(txt: str, fallback: QtGui.QColor) -> QtGui.QColor:
-        c = QtGui.QColor(txt)
-        return c if c.isValid() else fallback
+        rgb = _parse_hex(str(txt))
+        return QtGui.QColor(*rgb) if rgb is not None else fallback
     
     @property
     def core_width(self) -> int:
@@ -362,138 +574,121 @@ class Config:
 
     def update_colors_for_scheme(self):
         """Update colors based on the selected number of colors scheme"""
-        if self.num_colors == 1:
-            # 1 color: Cyan
-            self.color_start = QtGui.QColor(0, 255, 255)  # Cyan
-            self.color_mid = QtGui.QColor(0, 255, 255)    # Same
-            self.color_end = QtGui.QColor(0, 255, 255)    # Same
-        elif self.num_colors == 2:
-            # 2 colors: Burnt Orange -> Yellow
-            self.color_start = QtGui.QColor(255, 140, 0)  # Burnt Orange
-            self.color_mid = QtGui.QColor(255, 200, 0)    # Interpolated
-            self.color_end = QtGui.QColor(255, 255, 0)    # Yellow
-        elif self.num_colors == 3:
-            # 3 colors: Purple -> Burnt Orange -> Yellow
-            self.color_start = QtGui.QColor(170, 0, 255)  # Purple
-            self.color_mid = QtGui.QColor(255, 140, 0)    # Burnt Orange
-            self.color_end = QtGui.QColor(255, 255, 0)    # Yellow
-        else:  # 4 colors (rainbow)
-            # Rainbow: no color scheme updates needed - uses rainbow_1 through rainbow_6
-            pass
+        scheme = _SCHEME_COLORS.get(self.num_colors)
+        if scheme is None:
+            # Rainbow: no color scheme updates needed - uses rainbow_1 through rainbow_7
+            return
+        start, mid, end = scheme
+        self.color_start = QtGui.QColor(*start)
+        self.color_mid = QtGui.QColor(*mid)
+        self.color_end = QtGui.QColor(*end)
+    
+    def gradient_key(self) -> tuple:
+        """Everything the trail color gradient depends on (cache key for the color LUT)."""
+        return (self.num_colors,
+                self.color_start.rgb(), self.color_mid.rgb(), self.color_end.rgb(),
+                self.rainbow_1.rgb(), self.rainbow_2.rgb(), self.rainbow_3.rgb(), self.rainbow_4.rgb(),
+                self.rainbow_5.rgb(), self.rainbow_6.rgb(), self.rainbow_7.rgb())
+
+    def _stored_values(self) -> dict:
+        """Settings key -> value as written to QSettings."""
+        return {
+            "color_start": self._qcolor_to_hex(self.color_start),
+            "color_mid":   self._qcolor_to_hex(self.color_mid),
+            "color_end":   self._qcolor_to_hex(self.color_end),
+            "rainbow_1": self._qcolor_to_hex(self.rainbow_1),
+            "rainbow_2": self._qcolor_to_hex(self.rainbow_2),
+            "rainbow_3": self._qcolor_to_hex(self.rainbow_3),
+            "rainbow_4": self._qcolor_to_hex(self.rainbow_4),
+            "rainbow_5": self._qcolor_to_hex(self.rainbow_5),
+            "rainbow_6": self._qcolor_to_hex(self.rainbow_6),
+            "rainbow_7": self._qcolor_to_hex(self.rainbow_7),
+            "fade_seconds": self.fade_seconds,
+            "stroke_thickness": self.stroke_thickness,
+            "glow_percent": self.glow_percent,
+            "gradient_layers": self.gradient_layers,
+            "ema_alpha":    self.ema_alpha,
+            "min_dist_px":  self.min_dist_px,
+            "tension":      self.tension,
+            "fade_slowdown": self.fade_slowdown,
+            "num_colors": self.num_colors,
+            "particles_enabled": self.particles_enabled,
+            "explosion_frequency": self.explosion_frequency,
+            "explosion_intensity": self.explosion_intensity,
+            "comet_enabled": self.comet_enabled,
+            "draw_mode": self.draw_mode.value,
+        }
 
     def save(self, s: QtCore.QSettings):
-        s.setValue("color_start", self._qcolor_to_hex(self.color_start))
-        s.setValue("color_mid",   self._qcolor_to_hex(self.color_mid))
-        s.setValue("color_end",   self._qcolor_to_hex(self.color_end))
-        s.setValue("rainbow_1", self._qcolor_to_hex(self.rainbow_1))
-        s.setValue("rainbow_2", self._qcolor_to_hex(self.rainbow_2))
-        s.setValue("rainbow_3", self._qcolor_to_hex(self.rainbow_3))
-        s.setValue("rainbow_4", self._qcolor_to_hex(self.rainbow_4))
-        s.setValue("rainbow_5", self._qcolor_to_hex(self.rainbow_5))
-        s.setValue("rainbow_6", self._qcolor_to_hex(self.rainbow_6))
-        s.setValue("rainbow_7", self._qcolor_to_hex(self.rainbow_7))
-        s.setValue("fade_seconds", self.fade_seconds)
-        s.setValue("stroke_thickness", self.stroke_thickness)
-        s.setValue("glow_percent", self.glow_percent)
-        s.setValue("gradient_layers", self.gradient_layers)
-        s.setValue("ema_alpha",    self.ema_alpha)
-        s.setValue("min_dist_px",  self.min_dist_px)
-        s.setValue("tension",      self.tension)
-        s.setValue("fade_slowdown", self.fade_slowdown)
-        s.setValue("num_colors", self.num_colors)
-        s.setValue("particles_enabled", self.particles_enabled)
-        s.setValue("explosion_frequency", self.explosion_frequency)
-        s.setValue("explosion_intensity", self.explosion_intensity)
-        s.setValue("comet_enabled", self.comet_enabled)
-        s.setValue("draw_mode", self.draw_mode.value)
+        # Only write keys whose stored value changed since the last load/save
+        values = self._stored_values()
+        saved = self._saved
+        for key, value in values.items():
+            if saved.get(key) != value:
+                s.setValue(key, value)
+        self._saved = values
 
     @staticmethod
     def load(s: QtCore.QSettings) -> "Config":
         cfg = Config()
-        cfg.color_start = Config._hex_to_qcolor(s.value("color_start", "#AA00FF"), QtGui.QColor(170, 0, 255))
-        cfg.color_mid   = Config._hex_to_qcolor(s.value("color_mid",   "#FF8C00"), QtGui.QColor(255, 140, 0))
-        cfg.color_end   = Config._hex_to_qcolor(s.value("color_end",   "#FFFF00"), QtGui.QColor(255, 255, 0))
-        cfg.rainbow_1   = Config._hex_to_qcolor(s.value("rainbow_1",   "#FF0000"), QtGui.QColor(255, 0, 0))
-        cfg.rainbow_2   = Config._hex_to_qcolor(s.value("rainbow_2",   "#FFA500"), QtGui.QColor(255, 165, 0))
-        cfg.rainbow_3   = Config._hex_to_qcolor(s.value("rainbow_3",   "#FFFF00"), QtGui.QColor(255, 255, 0))
-        cfg.rainbow_4   = Config._hex_to_qcolor(s.value("rainbow_4",   "#00C837"), QtGui.QColor(0, 200, 55))
-        cfg.rainbow_5   = Config._hex_to_qcolor(s.value("rainbow_5",   "#4B00B4"), QtGui.QColor(75, 0, 180))
-        cfg.rainbow_6   = Config._hex_to_qcolor(s.value("rainbow_6",   "#800080"), QtGui.QColor(128, 0, 128))
-        cfg.rainbow_7   = Config._hex_to_qcolor(s.value("rainbow_7",   "#8B4513"), QtGui.QColor(139, 69, 19))
-        cfg.fade_seconds = float(s.value("fade_seconds", cfg.fade_seconds))
-        cfg.stroke_thickness = int(s.value("stroke_thickness", cfg.stroke_thickness))
-        cfg.glow_percent = int(s.value("glow_percent", cfg.glow_percent))
-        cfg.gradient_layers = int(s.value("gradient_layers", cfg.gradient_layers))
-        cfg.ema_alpha    = float(s.value("ema_alpha",  cfg.ema_alpha))
-        cfg.min_dist_px  = float(s.value("min_dist_px", cfg.min_dist_px))
-        cfg.tension      = float(s.value("tension",     cfg.tension))
-        cfg.fade_slowdown = float(s.value("fade_slowdown", cfg.fade_slowdown))
-        cfg.num_colors = int(s.value("num_colors", cfg.num_colors))
-        cfg.particles_enabled = s.value("particles_enabled", cfg.particles_enabled, type=bool)
-        cfg.explosion_frequency = float(s.value("explosion_frequency", cfg.explosion_frequency))
-        cfg.explosion_intensity = float(s.value("explosion_intensity", cfg.explosion_intensity))
-        cfg.comet_enabled = s.value("comet_enabled", cfg.comet_enabled, type=bool)
-        draw_mode_str = s.value("draw_mode", cfg.draw_mode.value)
+        # One pass over the stored keys, then plain dict lookups
+        raw = {k: s.value(k) for k in s.childKeys()}
+        cfg.color_start = Config._hex_to_qcolor(raw.get("color_start", "#AA00FF"), QtGui.QColor(170, 0, 255))
+        cfg.color_mid   = Config._hex_to_qcolor(raw.get("color_mid",   "#FF8C00"), QtGui.QColor(255, 140, 0))
+        cfg.color_end   = Config._hex_to_qcolor(raw.get("color_end",   "#FFFF00"), QtGui.QColor(255, 255, 0))
+        cfg.rainbow_1   = Config._hex_to_qcolor(raw.get("rainbow_1",   "#FF0000"), QtGui.QColor(255, 0, 0))
+        cfg.rainbow_2   = Config._hex_to_qcolor(raw.get("rainbow_2",   "#FFA500"), QtGui.QColor(255, 165, 0))
+        cfg.rainbow_3   = Config._hex_to_qcolor(raw.get("rainbow_3",   "#FFFF00"), QtGui.QColor(255, 255, 0))
+        cfg.rainbow_4   = Config._hex_to_qcolor(raw.get("rainbow_4",   "#00C837"), QtGui.QColor(0, 200, 55))
+        cfg.rainbow_5   = Config._hex_to_qcolor(raw.get("rainbow_5",   "#4B00B4"), QtGui.QColor(75, 0, 180))
+        cfg.rainbow_6   = Config._hex_to_qcolor(raw.get("rainbow_6",   "#800080"), QtGui.QColor(128, 0, 128))
+        cfg.rainbow_7   = Config._hex_to_qcolor(raw.get("rainbow_7",   "#8B4513"), QtGui.QColor(139, 69, 19))
+        cfg.fade_seconds = float(raw.get("fade_seconds", cfg.fade_seconds))
+        cfg.stroke_thickness = int(raw.get("stroke_thickness", cfg.stroke_thickness))
+        cfg.glow_percent = int(raw.get("glow_percent", cfg.glow_percent))
+        cfg.gradient_layers = int(raw.get("gradient_layers", cfg.gradient_layers))
+        cfg.ema_alpha    = float(raw.get("ema_alpha",  cfg.ema_alpha))
+        cfg.min_dist_px  = float(raw.get("min_dist_px", cfg.min_dist_px))
+        cfg.tension      = float(raw.get("tension",     cfg.tension))
+        cfg.fade_slowdown = float(raw.get("fade_slowdown", cfg.fade_slowdown))
+        cfg.num_colors = int(raw.get("num_colors", cfg.num_colors))
+        cfg.particles_enabled = _to_bool(raw.get("particles_enabled", cfg.particles_enabled))
+        cfg.explosion_frequency = float(raw.get("explosion_frequency", cfg.explosion_frequency))
+        cfg.explosion_intensity = float(raw.get("explosion_intensity", cfg.explosion_intensity))
+        cfg.comet_enabled = _to_bool(raw.get("comet_enabled", cfg.comet_enabled))
+        draw_mode_str = raw.get("draw_mode", cfg.draw_mode.value)
         try:
             cfg.draw_mode = DrawMode(draw_mode_str)
         except ValueError:
             cfg.draw_mode = DrawMode.FREEHAND
+        # Keys already in storage hold these values (missing ones still get written on save)
+        cfg._saved = {k: v for k, v in cfg._stored_values().items() if k in raw}
         return cfg
 
 # ------------------------- Overlay window -------------------------
+_SQRT2_OVER_2 = 0.7071067811865476  # cos 45° == sin 45°, for the arrow barbs
+_ARROW_STEPS = tuple(i / 10 for i in range(11))  # Interpolation points along each arrow stroke
+CAP_FADE_LEVELS = 64  # Distinct fade steps for the cached trail cap stamps
+SPARK_DIRTY_PAD = 28  # Largest spark radius (head + glow) plus its streak
+COMET_DIRTY_PAD = 6   # Largest ice crystal sparkle radius
+
+# Explicit __slots__ (no per-instance __dict__) keep the many small point/particle
+# objects compact; fields therefore can't have class-level defaults
 @dataclass
 class TrailPoint:
-    x: int; y: int; t: float; stroke: int; age: float = 0.0
+    __slots__ = ("x", "y", "t", "stroke")
+    x: int; y: int; t: float; stroke: int  # t: effective (pause-adjusted) creation time
 
 @dataclass
 class Spark:
-    x: float; y: float; vx: float; vy: float; t: float; life: float; is_trail: bool = False
+    __slots__ = ("x", "y", "vx", "vy", "t", "life", "is_trail")
+    x: float; y: float; vx: float; vy: float; t: float; life: float; is_trail: bool
 
 @dataclass
 class Comet:
+    __slots__ = ("x", "y", "vx", "vy", "t", "life", "size")
     x: float; y: float; vx: float; vy: float; t: float; life: float; size: float
 
-class ParticleUpdateThread(QtCore.QThread):
-    """Background thread for updating particle physics to improve performance."""
-    
-    def __init__(self, overlay):
-        super().__init__()
-        self.overlay = overlay
-        self.running = True
-        self.daemon = True
-    
-    def run(self):
-        """Main thread loop - updates particles at ~60 FPS in background."""
-        while self.running:
-            start_time = time.time()
-            
-            # Only update if not paused
-            if not self.overlay.paused:
-                now = time.time()
-                
-                # Check if position updates should be paused
-                position_paused = shift_down() or caps_lock_on()
-                
-                # Thread-safe particle updates
-                with self.overlay.particle_lock:
-                    if position_paused:
-                        # Don't update positions, but do check for cleanup (aging still works)
-                        self.overlay._cleanup_particles_only(now)
-                    else:
-                        # Update positions normally
-                        self.overlay._update_sparks_threaded(now)
-                        self.overlay._update_comets_threaded(now)
-            
-            # Maintain ~60 FPS (16ms per frame)
-            elapsed = time.time() - start_time
-            sleep_time = max(0, 0.016 - elapsed)
-            time.sleep(sleep_time)
-    
-    def stop(self):
-        """Stop the thread gracefully."""
-        self.running = False
-        self.wait()
-
 class Overlay(QtWidgets.QWidget):
     paused_changed = QtCore.pyqtSignal(bool)
 
@@ -531,15 +726,13 @@ class Overlay(QtWidgets.QWidget):
         self._temp_points: List[TrailPoint] = []  # Temporary points for current shape (cleared each frame)
         
         # Frozen time system for Shift/Caps Lock pause
-        self._frozen_time: Optional[float] = None
-        self._time_when_frozen: Optional[float] = None
+        self._frozen_time: Optional[float] = None  # Real time the current pause started
         self._total_pause_time: float = 0.0  # Total time spent paused
+        self._now = time.monotonic()  # Real time of the current frame, set by tick()
+        
+        self._dirty = QtGui.QRegion()  # Widget area covered by the last repaint
+        self._update_pending = False   # Full repaint already queued by _schedule_update
         
-        # Thread-safe particle updates
-        self.particle_lock = threading.Lock()
-        self.particle_thread = ParticleUpdateThread(self)
-        self.particle_thread.start()
-
         self.core_pen = QtGui.QPen(self.cfg.color_start)
         self.core_pen.setWidth(self.cfg.core_width)
         self.core_pen.setCapStyle(QtCore.Qt.FlatCap)
@@ -549,65 +742,91 @@ class Overlay(QtWidgets.QWidget):
         self.glow_pen.setWidth(self.cfg.glow_width)
         self.glow_pen.setCapStyle(QtCore.Qt.FlatCap)
         self.glow_pen.setJoinStyle(QtCore.Qt.RoundJoin)
+        
+        # Trail color by life fraction, rebuilt only when the color scheme changes
+        self._gradient_lut: List[QtGui.QColor] = []
+        self._gradient_lut_key: Optional[tuple] = None
+        self._refresh_gradient_lut()
 
         self.timer = QtCore.QTimer(self)
         self.timer.timeout.connect(self.tick)
         self.timer.start(16)  # ~60 FPS
     
-    def closeEvent(self, event):
-        """Clean up the particle update thread when closing."""
-        if hasattr(self, 'particle_thread'):
-            self.particle_thread.stop()
-        super().closeEvent(event)
-
     # ----- config updates -----
     def apply_config(self, cfg: Config):
         self.cfg = cfg
         self.core_pen.setWidth(self.cfg.core_width)
         self.glow_pen.setWidth(self.cfg.glow_width)
         # color is per-segment based on age; pen colors are set each draw
+        self._refresh_gradient_lut()
+        self._schedule_update()
+    
+    def _schedule_update(self):
+        """Full repaint on the next event-loop pass, however many changes arrive before it."""
+        if self._update_pending:
+            return
+        self._update_pending = True
+        QtCore.QTimer.singleShot(0, self._do_update)
+    
+    def _do_update(self):
+        self._update_pending = False
         self.update()
+    
+    def _refresh_gradient_lut(self):
+        """Rebuild the age -> color lookup table if the color settings changed."""
+        key = self.cfg.gradient_key()
+        if key == self._gradient_lut_key:
+            return
+        last = GRADIENT_LUT_SIZE - 1
+        self._gradient_lut = [self._gradient_color(i / last) for i in range(GRADIENT_LUT_SIZE)]
+        self._gradient_lut_key = key
 
     def set_paused(self, p: bool):
         self.paused = p
         self.paused_changed.emit(p)
     
+    def update_geometry(self):
+        """Re-cover the virtual desktop after the display configuration changes."""
+        vr = virtual_rect()
+        if vr != self.vr:
+            self.vr = vr  # points are global; painting converts with the new origin
+            self.setGeometry(vr.left(), vr.top(), vr.width(), vr.height())
+            self.update()
+    
+    def nativeEvent(self, event_type, message):
+        """Resync hooked key state on session unlock (keys released on the lock screen)."""
+        if event_type == b"windows_generic_MSG":
+            msg = wintypes.MSG.from_address(int(message))
+            if msg.message == WM_WTSSESSION_CHANGE and msg.wParam == WTS_SESSION_UNLOCK:
+                _resync_hook_keys()
+        return False, 0
+    
     def change_draw_mode(self, mode: DrawMode, settings: QtCore.QSettings):
         """Change the drawing mode via keyboard shortcut and save to settings."""
         self.cfg.draw_mode = mode
         self.cfg.save(settings)  # Persist the change
     
-    def get_effective_time(self) -> float:
-        """Get current time, but frozen during Shift/Caps Lock pause."""
-        now = time.time()
-        
-        # Check if we should be frozen
+    def _update_freeze(self, now: float) -> bool:
+        """Start or end a Shift/Caps Lock pause on the key-state edge; returns whether frozen."""
         should_be_frozen = shift_down() or caps_lock_on()
-        
-        if should_be_frozen:
-            if self._frozen_time is None:
+        if should_be_frozen != (self._frozen_time is not None):
+            if should_be_frozen:
                 # Just started freezing - capture current time
                 self._frozen_time = now
-                self._time_when_frozen = now
-            # Return the frozen time
-            return self._frozen_time
-        else:
-            if self._frozen_time is not None:
+            else:
                 # Just unfroze - track total pause time
-                frozen_duration = now - self._time_when_frozen
-                self._total_pause_time += frozen_duration
+                self._total_pause_time += now - self._frozen_time
                 self._frozen_time = None
-                self._time_when_frozen = None
-            # Return normal time minus total pause time
-            return now - self._total_pause_time
+        return should_be_frozen
     
-    def get_adjusted_age(self, creation_time: float, current_time: float) -> float:
-        """Calculate age accounting for pause time."""
+    def _age_base(self, current_time: float) -> float:
+        """Pause-adjusted clock that creation times are subtracted from (age = base - t).
+        
+        Constant within a frame, so loops over many particles compute it once.
+        """
         # If we're currently paused, use the time when we started pausing
-        if self._frozen_time is not None:
-            return self._frozen_time - creation_time - self._total_pause_time
-        else:
-            return current_time - creation_time - self._total_pause_time
+        frozen = self._frozen_time
+        return (current_time if frozen is None else frozen) - self._total_pause_time
     
     def _create_rectangle(self, start: Tuple[float, float], end: Tuple[float, float], now: float, temporary: bool = False):
         """Create rectangle trail points from start corner to end corner."""
@@ -650,18 +869,21 @@ class Overlay(QtWidgets.QWidget):
         end_x, end_y = end
         
         # Calculate radius
-        radius = math.sqrt((end_x - center_x)**2 + (end_y - center_y)**2)
+        radius = math.hypot(end_x - center_x, end_y - center_y)
         
         # Create circle points
         num_points = max(20, int(radius * 0.5))  # More points for larger circles
         points = []
         
-        for i in range(num_points):
-            angle = (2 * math.pi * i) / num_points
-            x = center_x + radius * math.cos(angle)
-            y = center_y + radius * math.sin(angle)
-            point = TrailPoint(int(x), int(y), now, self.stroke_id)
-            points.append(point)
+        # Walk the circle by rotating the radius vector a fixed step each point
+        # (one cos/sin pair per circle instead of one per point)
+        step = 2 * math.pi / num_points
+        cos_step = math.cos(step); sin_step = math.sin(step)
+        dx, dy = radius, 0.0
+        stroke_id = self.stroke_id
+        for _ in range(num_points):
+            points.append(TrailPoint(int(center_x + dx), int(center_y + dy), now, stroke_id))
+            dx, dy = dx * cos_step - dy * sin_step, dx * sin_step + dy * cos_step
         
         if temporary:
             self._temp_points = points
@@ -676,7 +898,7 @@ class Overlay(QtWidgets.QWidget):
         # Calculate main arrow shaft vector
         shaft_dx = tip_x - tail_x
         shaft_dy = tip_y - tail_y
-        shaft_length = math.sqrt(shaft_dx**2 + shaft_dy**2)
+        shaft_length = math.hypot(shaft_dx, shaft_dy)
         
         if shaft_length == 0:
             return  # No arrow if no distance
@@ -688,30 +910,23 @@ class Overlay(QtWidgets.QWidget):
         # Calculate arrowhead length: min(half shaft length, 10x stroke thickness)
         arrowhead_length = min(shaft_length / 2, self.cfg.stroke_thickness * 10)
         
-        # Calculate 45-degree angles from the shaft direction (going backwards from tip)
-        cos_45 = math.cos(math.radians(45))
-        sin_45 = math.sin(math.radians(45))
-        
         # Reverse shaft direction (pointing backwards from tip)
         reverse_shaft_x = -shaft_unit_x
         reverse_shaft_y = -shaft_unit_y
         
-        # Rotate reverse shaft direction by +45 degrees for first barb
-        barb1_unit_x = reverse_shaft_x * cos_45 + reverse_shaft_y * sin_45
-        barb1_unit_y = -reverse_shaft_x * sin_45 + reverse_shaft_y * cos_45
+        # Rotate reverse shaft direction by +45 degrees for first barb (cos 45 = sin 45)
+        barb1_unit_x = (reverse_shaft_x + reverse_shaft_y) * _SQRT2_OVER_2
+        barb1_unit_y = (reverse_shaft_y - reverse_shaft_x) * _SQRT2_OVER_2
         barb1_x = tip_x + arrowhead_length * barb1_unit_x
         barb1_y = tip_y + arrowhead_length * barb1_unit_y
         
         # Rotate reverse shaft direction by -45 degrees for second barb
-        barb2_unit_x = reverse_shaft_x * cos_45 - reverse_shaft_y * sin_45
-        barb2_unit_y = reverse_shaft_x * sin_45 + reverse_shaft_y * cos_45
+        barb2_unit_x = (reverse_shaft_x - reverse_shaft_y) * _SQRT2_OVER_2
+        barb2_unit_y = (reverse_shaft_x + reverse_shaft_y) * _SQRT2_OVER_2
         barb2_x = tip_x + arrowhead_length * barb2_unit_x
         barb2_y = tip_y + arrowhead_length * barb2_unit_y
         
         # Create three separate strokes: main shaft, and two barbs
-        points = []
-        points_per_stroke = 10
-        
         # Use consistent stroke IDs for both temporary and permanent arrows
         if temporary:
             # For temporary arrows, use negative IDs to completely avoid conflicts
@@ -721,29 +936,14 @@ class Overlay(QtWidgets.QWidget):
             base_stroke_id = self.stroke_id
             self.stroke_id += 3  # Reserve 3 stroke IDs
         
-        # Stroke 1: Main shaft from tail to tip
-        shaft_stroke_id = base_stroke_id
-        for i in range(points_per_stroke + 1):
-            t = i / points_per_stroke
-            x = tail_x + (tip_x - tail_x) * t
-            y = tail_y + (tip_y - tail_y) * t
-            points.append(TrailPoint(int(x), int(y), now, shaft_stroke_id))
-        
-        # Stroke 2: First barb from tip to barb1 (separate stroke ID)
-        barb1_stroke_id = base_stroke_id + 1
-        for i in range(points_per_stroke + 1):  
-            t = i / points_per_stroke
-            x = tip_x + (barb1_x - tip_x) * t
-            y = tip_y + (barb1_y - tip_y) * t
-            points.append(TrailPoint(int(x), int(y), now, barb1_stroke_id))
-        
-        # Stroke 3: Second barb from tip to barb2 (separate stroke ID)
-        barb2_stroke_id = base_stroke_id + 2
-        for i in range(points_per_stroke + 1):  
-            t = i / points_per_stroke
-            x = tip_x + (barb2_x - tip_x) * t
-            y = tip_y + (barb2_y - tip_y) * t
-            points.append(TrailPoint(int(x), int(y), now, barb2_stroke_id))
+        def line(x0: float, y0: float, x1: float, y1: float, stroke_id: int) -> List[TrailPoint]:
+            dx = x1 - x0; dy = y1 - y0
+            return [TrailPoint(int(x0 + dx * t), int(y0 + dy * t), now, stroke_id) for t in _ARROW_STEPS]
+        
+        # Stroke 1: Main shaft from tail to tip; strokes 2/3: barbs from tip (separate stroke IDs)
+        points = (line(tail_x, tail_y, tip_x, tip_y, base_stroke_id) +
+                  line(tip_x, tip_y, barb1_x, barb1_y, base_stroke_id + 1) +
+                  line(tip_x, tip_y, barb2_x, barb2_y, base_stroke_id + 2))
         
         if temporary:
             self._temp_points = points
@@ -752,14 +952,12 @@ class Overlay(QtWidgets.QWidget):
 
     # ----- sampling / smoothing -----
     def tick(self):
+        # Read the clock once per frame; monotonic so wall-clock changes can't jump ages
+        real_now = self._now = time.monotonic()  # Keep real time for frame timing
+        frozen = self._update_freeze(real_now)
         # Use effective time (frozen during Shift/Caps Lock)
-        now = self.get_effective_time()
-        real_now = time.time()  # Keep real time for frame timing
-        
-        # Increment age for all trail points (only when not frozen by Shift/Caps Lock)
-        if not shift_down() and not caps_lock_on():
-            for point in self.points:
-                point.age += 0.016  # 16ms increment
+        # Point/particle ages are now - t, so they stand still while frozen
+        now = self._age_base(real_now)
         
         if not self.paused:
             pressed = ctrl_down()
@@ -775,7 +973,7 @@ class Overlay(QtWidgets.QWidget):
                 
                 # Handle shape modes
                 if self.cfg.draw_mode != DrawMode.FREEHAND:
-                    rx, ry = pyautogui.position()
+                    rx, ry = cursor_pos()
                     self._shape_start = (float(rx), float(ry))
                     self._shape_active = True
                     # Clear any existing trail points from current stroke to avoid interference
@@ -785,7 +983,7 @@ class Overlay(QtWidgets.QWidget):
                 # CTRL just released
                 if self.cfg.draw_mode != DrawMode.FREEHAND and self._shape_active:
                     # Complete shape
-                    rx, ry = pyautogui.position()
+                    rx, ry = cursor_pos()
                     if self._shape_start:
                         if self.cfg.draw_mode == DrawMode.RECTANGLE:
                             self._create_rectangle(self._shape_start, (float(rx), float(ry)), now)
@@ -797,7 +995,7 @@ class Overlay(QtWidgets.QWidget):
                     self._shape_start = None
                     
             if pressed and self.cfg.draw_mode == DrawMode.FREEHAND:
-                rx, ry = pyautogui.position()
+                rx, ry = cursor_pos()
                 if self._ema_xy is None:
                     sx, sy = float(rx), float(ry)
                 else:
@@ -816,7 +1014,7 @@ class Overlay(QtWidgets.QWidget):
                 
                 # Generate explosions at regular time intervals while CTRL is held (if enabled)
                 # Only generate when SHIFT is not held AND CAPS LOCK is off
-                if not shift_down() and not caps_lock_on():
+                if not frozen:
                     # Explosions happen based on frequency setting (explosions per second) OR distance moved
                     explosion_interval = 1.0 / self.cfg.explosion_frequency  # Convert frequency to interval
                     time_triggered = now - self._last_explosion_time >= explosion_interval
@@ -831,18 +1029,16 @@ class Overlay(QtWidgets.QWidget):
                         distance_triggered = distance_moved > 40
                     
                     if self.cfg.particles_enabled and (time_triggered or distance_triggered):
-                        import random
                         # Generate explosion at current mouse position (thread-safe)
-                        if random.random() < 1:  # 100% chance to generate explosion
+                        if _random() < 1:  # 100% chance to generate explosion
                             intensity = random.choice([1, 1, 1, 2, 3])  # Vary intensity
-                            with self.particle_lock:
-                                # Generate main explosion
-                                for _ in range(intensity):
-                                    self._generate_sparks(sx, sy, now)
-                                
-                                # Generate intermediate particles along the curve if we have a previous explosion IN THE SAME STROKE
-                                if self._last_explosion_pos is not None and self._last_explosion_stroke == self.stroke_id:
-                                    self._generate_curve_particles(self._last_explosion_pos, (sx, sy), now)
+                            # Generate main explosion
+                            for _ in range(intensity):
+                                self._generate_sparks(sx, sy, now)
+                            
+                            # Generate intermediate particles along the curve if we have a previous explosion IN THE SAME STROKE
+                            if self._last_explosion_pos is not None and self._last_explosion_stroke == self.stroke_id:
+                                self._generate_curve_particles(self._last_explosion_pos, (sx, sy), now)
                         
                         # Update last explosion position, time, and stroke
                         self._last_explosion_pos = (sx, sy)
@@ -851,36 +1047,33 @@ class Overlay(QtWidgets.QWidget):
                     
                     # Generate ice crystal tails continuously while CTRL is held (if enabled)
                     if self.cfg.comet_enabled and now - self._last_comet_time >= 0.001:  # 1000 generations per second
-                        import random
-                        import math
                         
-                        # Generate comets with thread-safe access
-                        with self.particle_lock:
-                            # If we have a previous comet position, backfill the space between
-                            if self._last_comet_pos is not None:
-                                last_x, last_y = self._last_comet_pos
-                                # Calculate distance between last position and current position
-                                dx = sx - last_x
-                                dy = sy - last_y
-                                distance = math.sqrt(dx*dx + dy*dy)
-                                
-                                # Generate ice crystals along the path to fill the gap
-                                if distance > 0:
-                                    # Number of steps to fill the gap (every 2 pixels)
-                                    steps = max(1, int(distance / 2))
-                                    for step in range(steps + 1):
-                                        # Interpolate position along the path
-                                        t = step / max(1, steps)
-                                        fill_x = last_x + dx * t
-                                        fill_y = last_y + dy * t
-                                        
-                                        # Generate dense ice crystals at each fill position
-                                        for _ in range(random.randint(0, 7)):  # Reduced crystals at each point
-                                            self._generate_comet(fill_x, fill_y, now)
-                            else:
-                                # First generation - just generate at current position
-                                for _ in range(random.randint(100, 300)):  # 100-300 ice crystals per generation
-                                    self._generate_comet(sx, sy, now)
+                        # Generate comets
+                        # If we have a previous comet position, backfill the space between
+                        if self._last_comet_pos is not None:
+                            last_x, last_y = self._last_comet_pos
+                            # Calculate distance between last position and current position
+                            dx = sx - last_x
+                            dy = sy - last_y
+                            distance = math.sqrt(dx*dx + dy*dy)
+                            
+                            # Generate ice crystals along the path to fill the gap
+                            if distance > 0:
+                                # Number of steps to fill the gap (every 2 pixels)
+                                steps = max(1, int(distance / 2))
+                                for step in range(steps + 1):
+                                    # Interpolate position along the path
+                                    t = step / max(1, steps)
+                                    fill_x = last_x + dx * t
+                                    fill_y = last_y + dy * t
+                                    
+                                    # Generate dense ice crystals at each fill position
+                                    for _ in range(_randint(0, 7)):  # Reduced crystals at each point
+                                        self._generate_comet(fill_x, fill_y, now)
+                        else:
+                            # First generation - just generate at current position
+                            for _ in range(_randint(100, 300)):  # 100-300 ice crystals per generation
+                                self._generate_comet(sx, sy, now)
                         
                         # Update last comet position and time
                         self._last_comet_pos = (sx, sy)
@@ -894,7 +1087,7 @@ class Overlay(QtWidgets.QWidget):
             
             # Create temporary shape for current frame while CTRL is held
             if pressed and self.cfg.draw_mode != DrawMode.FREEHAND and self._shape_active and self._shape_start:
-                rx, ry = pyautogui.position()
+                rx, ry = cursor_pos()
                 # Only create temporary shape if mouse has moved significantly from start
                 distance = ((rx - self._shape_start[0])**2 + (ry - self._shape_start[1])**2)**0.5
                 if distance > 5:  # Minimum distance to avoid tiny shapes
@@ -907,31 +1100,94 @@ class Overlay(QtWidgets.QWidget):
                 
             self.prev_ctrl = pressed
 
-        # Remove trail points based on age instead of time
-        if self.points:
-            self.points = [p for p in self.points if p.age < self.cfg.fade_seconds]
+        # Remove trail points that have faded out; points are kept oldest first,
+        # so only the expired prefix is scanned
+        pts = self.points
+        if pts:
+            cutoff = now - self.cfg.fade_seconds
+            n = 0
+            while n < len(pts) and pts[n].t <= cutoff: n += 1
+            if n: del pts[:n]
         
-        # Particle updates are now handled by background thread for better performance
-        # No need to update sparks/comets here anymore
-        
-        self.update()
+        # Step particle physics on the same timer that paints them (no thread, no lock)
+        if not self.paused:
+            if frozen:
+                # Don't update positions, but do check for cleanup (aging still works)
+                self._cleanup_particles_only(real_now)
+            else:
+                self._update_sparks(real_now)
+                self._update_comets(real_now)
+        
+        # Repaint only what is drawn now plus what was drawn last frame (so
+        # faded points and particles get erased), not the whole virtual desktop
+        dirty = QtGui.QRegion()
+        for rect in self._trail_rects(self.points) + self._trail_rects(self._temp_points):
+            dirty = dirty.united(rect)
+        dirty = dirty.united(self._particle_rect(self.sparks, SPARK_DIRTY_PAD))
+        dirty = dirty.united(self._particle_rect(self.comets, COMET_DIRTY_PAD))
+        region = dirty.united(self._dirty)
+        if not region.isEmpty():
+            self.update(region)
+        self._dirty = dirty
 
     # ----- utils -----
+    def _trail_rects(self, pts: List[TrailPoint]) -> List[QtCore.QRect]:
+        """Widget-local bounds of each stroke in pts, padded to cover glow, caps and curve overshoot."""
+        rects = []
+        ox = self.vr.left(); oy = self.vr.top()
+        half = self.cfg.glow_width / 2 + 2  # Glow/cap radius plus antialiasing
+        reach = self.cfg.tension / 3.0      # Bezier controls sit up to tension/3 of the longest step away
+        n = len(pts); i = 0
+        while i < n:
+            p = pts[i]; sid = p.stroke
+            x0 = x1 = px = p.x; y0 = y1 = py = p.y; step = 0
+            i += 1
+            while i < n and pts[i].stroke == sid:
+                p = pts[i]; x = p.x; y = p.y
+                if x < x0: x0 = x
+                elif x > x1: x1 = x
+                if y < y0: y0 = y
+                elif y > y1: y1 = y
+                step = max(step, abs(x - px), abs(y - py))
+                px = x; py = y
+                i += 1
+            pad = int(half + step * reach) + 1
+            rects.append(QtCore.QRect(int(x0) - ox - pad, int(y0) - oy - pad,
+                                      int(x1 - x0) + 2 * pad + 1, int(y1 - y0) + 2 * pad + 1))
+        return rects
+
+    def _particle_rect(self, particles, pad: int) -> QtCore.QRect:
+        """Widget-local bounds of a spark/comet list grown by their drawn radius."""
+        if not particles:
+            return QtCore.QRect()
+        xs = [p.x for p in particles]; ys = [p.y for p in particles]
+        x0 = int(min(xs)) - self.vr.left() - pad; y0 = int(min(ys)) - self.vr.top() - pad
+        return QtCore.QRect(x0, y0, int(max(xs) - min(xs)) + 2 * pad + 2, int(max(ys) - min(ys)) + 2 * pad + 2)
+
     def _to_local(self, x: float, y: float) -> Tuple[float, float]:
         return x - self.vr.left(), y - self.vr.top()
 
-    def _catmull_rom_to_bezier(self, p0, p1, p2, p3, tension: float):
-        c1 = QtCore.QPointF(p1.x() + (p2.x() - p0.x()) * (tension / 6.0),
-                            p1.y() + (p2.y() - p0.y()) * (tension / 6.0))
-        c2 = QtCore.QPointF(p2.x() - (p3.x() - p1.x()) * (tension / 6.0),
-                            p2.y() - (p3.y() - p1.y()) * (tension / 6.0))
-        return c1, c2
+    def _stroke_columns(self, segment: List[TrailPoint]):
+        """Widget-local point columns of a stroke and its Catmull–Rom Bézier control columns.
+        
+        Returns (xs, ys, c1x, c1y, c2x, c2y); curve k runs from point k to k+1
+        through controls k. Computed column-wise, once per stroke per paint.
+        """
+        ox = self.vr.left(); oy = self.vr.top(); f = self.cfg.tension / 6.0
+        xs = [p.x - ox for p in segment]
+        ys = [p.y - oy for p in segment]
+        # Tangent at each point from its neighbours, ends clamped (p0 = p1 first, p3 = p2 last)
+        tx = [(b - a) * f for a, b in zip(xs[:1] + xs[:-1], xs[1:] + xs[-1:])]
+        ty = [(b - a) * f for a, b in zip(ys[:1] + ys[:-1], ys[1:] + ys[-1:])]
+        c1x = [x + t for x, t in zip(xs, tx[:-1])]
+        c1y = [y + t for y, t in zip(ys, ty[:-1])]
+        c2x = [x - t for x, t in zip(xs[1:], tx[1:])]
+        c2y = [y - t for y, t in zip(ys[1:], ty[1:])]
+        return xs, ys, c1x, c1y, c2x, c2y
 
     # ----- sparks -----
     def _generate_sparks(self, x: float, y: float, now: float):
         """Generate massive asteroid-like explosion with particles flying everywhere."""
-        import random
-        import math
         
         # Mathematical formula for particle count based on intensity
         # Formula: base_particles * intensity^1.2 + random_variance
@@ -945,38 +1201,29 @@ class Overlay(QtWidgets.QWidget):
         min_particles = max(1, calculated_particles - variance)
         max_particles = max(2, calculated_particles + variance)
         
-        num_sparks = random.randint(min_particles, max_particles)
+        num_sparks = _randint(min_particles, max_particles)
         
+        # The old extra ±0.3 rad angle jitter is folded away: an angle uniform over the
+        # full circle plus any independent jitter is still uniform over the circle
+        append = self.sparks.append
         for _ in range(num_sparks):
-            # Generate explosion angle with upward bias
-            angle = random.uniform(0, 2 * math.pi)
-            # Bias particles to shoot upward initially (add upward velocity component)
-            upward_bias = random.uniform(-80, -20)  # Strong upward initial velocity
-            
+            # Generate explosion angle
+            angle = _uniform(0, _TWO_PI)
             # Varied speeds for more chaotic, realistic asteroid explosion (2.5x bigger)
-            speed = random.uniform(25, 200)  # 2.5x bigger explosion velocities (halved from 5x)
-            
-            # Add some randomness to the angle for more natural spread
-            angle_variation = random.uniform(-0.3, 0.3)  # Small random variation
-            final_angle = angle + angle_variation
-            
-            vx = math.cos(final_angle) * speed
-            vy = math.sin(final_angle) * speed + upward_bias  # Add upward bias
-            
+            speed = _uniform(25, 200)  # 2.5x bigger explosion velocities (halved from 5x)
+            # Bias particles to shoot upward initially (strong upward initial velocity)
+            upward_bias = _uniform(-80, -20)
             # Add some random "chaos" to make it less perfect
-            chaos_factor = random.uniform(0.8, 1.2)
-            vx *= chaos_factor
-            vy *= chaos_factor
+            chaos_factor = _uniform(0.8, 1.2)
             
-            # Longer lifetimes for bigger explosions
-            life = random.uniform(1.5, 3.0)  # 2x longer life for bigger particles
+            vx = _cos(angle) * speed * chaos_factor
+            vy = (_sin(angle) * speed + upward_bias) * chaos_factor
             
-            self.sparks.append(Spark(x, y, vx, vy, now, life, is_trail=False))
+            # Longer lifetimes for bigger explosions (2x longer life for bigger particles)
+            append(Spark(x, y, vx, vy, now, _uniform(1.5, 3.0), False))
     
     def _generate_curve_particles(self, start_pos: Tuple[float, float], end_pos: Tuple[float, float], now: float):
         """Generate particles along the straight line between two explosion points."""
-        import random
-        import math
         
         start_x, start_y = start_pos
         end_x, end_y = end_pos
@@ -984,7 +1231,7 @@ class Overlay(QtWidgets.QWidget):
         # Calculate distance between explosions
         dx = end_x - start_x
         dy = end_y - start_y
-        distance = math.sqrt(dx*dx + dy*dy)
+        distance = math.hypot(dx, dy)
         
         # Only generate intermediate particles if explosions are reasonably far apart
         if distance < 20:  # Too close, skip
@@ -994,64 +1241,27 @@ class Overlay(QtWidgets.QWidget):
         num_particles = max(2, min(15, int(distance / 30)))  # 2-15 particles
         
         # Generate particles along a straight line between the two points
-        for i in range(num_particles):
-            # Calculate interpolation factor (0.0 to 1.0)
-            t = (i + 1) / (num_particles + 1)  # Skip start and end points
-            
+        step = 1.0 / (num_particles + 1)  # Skip start and end points
+        sparks = self.sparks
+        for i in range(1, num_particles + 1):
             # Simple linear interpolation for straight line
-            line_x = start_x + t * (end_x - start_x)
-            line_y = start_y + t * (end_y - start_y)
-            
-            # Generate smaller, more subtle particles along the line
-            for _ in range(random.randint(1, 3)):  # 1-3 particles per point
-                # Small random offset from line point
-                px = line_x + random.uniform(-5, 5)
-                py = line_y + random.uniform(-5, 5)
-                
-                # Gentle upward velocity with some randomness
-                vx = random.uniform(-20, 20)  # Gentle horizontal spread
-                vy = random.uniform(-40, -10)  # Gentle upward motion
-                
-                # Shorter lifetime for intermediate particles
-                life = random.uniform(0.8, 1.5)
-                
-                # Create spark with trail flag to distinguish from main explosions
-                self.sparks.append(Spark(px, py, vx, vy, now, life, is_trail=True))
+            line_x = start_x + i * step * dx
+            line_y = start_y + i * step * dy
+            
+            # Generate smaller, more subtle particles along the line: 1-3 per point with a
+            # small random offset, gentle horizontal spread and upward motion, and a shorter
+            # lifetime; trail flag distinguishes them from main explosions
+            sparks.extend(Spark(line_x + _uniform(-5, 5), line_y + _uniform(-5, 5),
+                                _uniform(-20, 20), _uniform(-40, -10), now, _uniform(0.8, 1.5), True)
+                          for _ in range(_randint(1, 3)))
     
-    def _update_sparks(self, now: float):
-        """Update spark positions and remove expired ones with realistic physics."""
-        dt = 0.016  # 16ms frame time
-        
-        # Update existing sparks
-        for spark in self.sparks[:]:  # Copy list to avoid modification during iteration
-            age = now - spark.t
-            if age > spark.life:
-                self.sparks.remove(spark)
-                continue
-            
-            # Update position based on velocity
-            spark.x += spark.vx * dt
-            spark.y += spark.vy * dt
-            
-            # Cursor sparks: apply realistic firework physics
-            # Gravity pulls down
-            gravity = 200  # pixels per second squared
-            spark.vy += gravity * dt
-            
-            # Air resistance/drag - slows down sparks over time
-            drag_factor = 0.98  # Slight air resistance
-            spark.vx *= drag_factor
-            spark.vy *= drag_factor
-
     # ----- comets -----
     def _generate_comet(self, x: float, y: float, now: float):
         """Generate ice particles flying perpendicular to mouse movement direction."""
-        import random
-        import math
         
         # Start at cursor position with slight random offset
-        comet_x = x + random.uniform(-3, 3)
-        comet_y = y + random.uniform(-3, 3)
+        comet_x = x + _uniform(-3, 3)
+        comet_y = y + _uniform(-3, 3)
         
         # Calculate perpendicular direction based on mouse movement
         if self._prev_mouse_pos is not None:
@@ -1072,165 +1282,111 @@ class Overlay(QtWidgets.QWidget):
                 perp_right_y = -move_dir_x
                 
                 # Randomly choose left or right perpendicular direction
-                if random.random() < 0.5:
+                if _random() < 0.5:
                     perp_x, perp_y = perp_left_x, perp_left_y
                 else:
                     perp_x, perp_y = perp_right_x, perp_right_y
                 
                 # Add some angle variation (±30 degrees) for natural spread
-                angle_variation = random.uniform(-0.52, 0.52)  # ±30 degrees in radians
-                cos_var = math.cos(angle_variation)
-                sin_var = math.sin(angle_variation)
+                angle_variation = _uniform(-0.52, 0.52)  # ±30 degrees in radians
+                cos_var = _cos(angle_variation)
+                sin_var = _sin(angle_variation)
                 
                 # Apply rotation to perpendicular direction
                 final_x = perp_x * cos_var - perp_y * sin_var
                 final_y = perp_x * sin_var + perp_y * cos_var
                 
                 # Set velocity with random speed (3x faster for 3x distance)
-                speed = random.uniform(75, 180)  # 3x the original speed
+                speed = _uniform(75, 180)  # 3x the original speed
                 vx = final_x * speed
                 vy = final_y * speed
             else:
                 # If mouse isn't moving, use random radial direction
-                angle = random.uniform(0, 2 * math.pi)
-                speed = random.uniform(45, 105)  # 3x the original speed
-                vx = math.cos(angle) * speed
-                vy = math.sin(angle) * speed
+                angle = _uniform(0, _TWO_PI)
+                speed = _uniform(45, 105)  # 3x the original speed
+                vx = _cos(angle) * speed
+                vy = _sin(angle) * speed
         else:
             # No previous position, use random direction
-            angle = random.uniform(0, 2 * math.pi)
-            speed = random.uniform(45, 105)  # 3x the original speed
-            vx = math.cos(angle) * speed
-            vy = math.sin(angle) * speed
+            angle = _uniform(0, _TWO_PI)
+            speed = _uniform(45, 105)  # 3x the original speed
+            vx = _cos(angle) * speed
+            vy = _sin(angle) * speed
         
         # Random size and lifetime for ice crystals (halved from previous)
-        size = random.uniform(0.8, 2.5)
-        life = random.uniform(0.75, 1.875)  # Halved again for better performance
+        size = _uniform(0.8, 2.5)
+        life = _uniform(0.75, 1.875)  # Halved again for better performance
         
         self.comets.append(Comet(comet_x, comet_y, vx, vy, now, life, size))
     
-    def _update_comets(self, now: float):
-        """Update ice crystal positions and remove expired ones."""
+    def _update_sparks(self, now: float):
+        """Update spark positions and remove expired ones with realistic physics."""
         dt = 0.016  # 16ms frame time
+        age_base = self._age_base(now)  # spark age = age_base - spark.t
         
-        # Update existing ice crystals
-        for comet in self.comets[:]:  # Copy list to avoid modification during iteration
-            age = now - comet.t
-            if age > comet.life:
-                self.comets.remove(comet)
-                continue
-            
-            # Update position based on velocity
-            comet.x += comet.vx * dt
-            comet.y += comet.vy * dt
-            
-            # Ice crystal physics - very light and floaty
-            drag_factor = 0.94  # High drag - ice crystals slow down quickly
-            comet.vx *= drag_factor
-            comet.vy *= drag_factor
-            
-            # Very light gravity - ice crystals float more than fall
-            comet.vy += 15 * dt  # Very light gravity
-            
-            # Add slight random drift for natural ice crystal movement
-            import random
-            comet.vx += random.uniform(-2, 2) * dt
-            comet.vy += random.uniform(-1, 1) * dt
-    
-    def _update_sparks_threaded(self, now: float):
-        """Thread-safe version of _update_sparks for background processing."""
-        dt = 0.016  # 16ms frame time
+        # Cursor sparks: apply realistic firework physics
+        gravity_dv = 200 * dt  # Gravity pulls down (200 pixels per second squared)
+        drag_factor = 0.98     # Air resistance/drag - slows down sparks over time
         
-        # Update existing sparks (thread-safe)
-        sparks_to_remove = []
-        for i, spark in enumerate(self.sparks):
-            age = self.get_adjusted_age(spark.t, now)
-            if age > spark.life:
-                sparks_to_remove.append(i)
-                continue
-            
+        # Drop expired sparks in one O(n) pass, then step the survivors
+        self.sparks = sparks = [spark for spark in self.sparks if age_base - spark.t <= spark.life]
+        for spark in sparks:
             # Update position based on velocity
             spark.x += spark.vx * dt
             spark.y += spark.vy * dt
             
-            # Cursor sparks: apply realistic firework physics
-            # Gravity pulls down
-            gravity = 200  # pixels per second squared
-            spark.vy += gravity * dt
-            
-            # Air resistance/drag - slows down sparks over time
-            drag_factor = 0.98  # Slight air resistance
+            # Gravity, then drag
             spark.vx *= drag_factor
-            spark.vy *= drag_factor
-        
-        # Remove expired sparks (in reverse order to maintain indices)
-        for i in reversed(sparks_to_remove):
-            del self.sparks[i]
+            spark.vy = (spark.vy + gravity_dv) * drag_factor
     
     def _cleanup_particles_only(self, now: float):
         """Remove expired particles without updating positions (for pause mode)."""
-        # Clean up expired sparks
-        sparks_to_remove = []
-        for i, spark in enumerate(self.sparks):
-            age = self.get_adjusted_age(spark.t, now)
-            if age > spark.life:
-                sparks_to_remove.append(i)
-        
-        for i in reversed(sparks_to_remove):
-            del self.sparks[i]
-        
-        # Clean up expired comets
-        comets_to_remove = []
-        for i, comet in enumerate(self.comets):
-            age = self.get_adjusted_age(comet.t, now)
-            if age > comet.life:
-                comets_to_remove.append(i)
-        
-        for i in reversed(comets_to_remove):
-            del self.comets[i]
+        age_base = self._age_base(now)  # particle age = age_base - t
+        
+        # Clean up expired sparks and comets (one O(n) pass each)
+        if self.sparks:
+            self.sparks = [spark for spark in self.sparks if age_base - spark.t <= spark.life]
+        if self.comets:
+            self.comets = [comet for comet in self.comets if age_base - comet.t <= comet.life]
     
-    def _update_comets_threaded(self, now: float):
-        """Thread-safe version of _update_comets for background processing."""
+    def _update_comets(self, now: float):
+        """Update ice crystal positions and remove expired ones."""
         dt = 0.016  # 16ms frame time
+        age_base = self._age_base(now)  # crystal age = age_base - comet.t
         
-        # Update existing ice crystals (thread-safe)
-        comets_to_remove = []
-        for i, comet in enumerate(self.comets):
-            age = self.get_adjusted_age(comet.t, now)
-            if age > comet.life:
-                comets_to_remove.append(i)
-                continue
-            
+        # Ice crystal physics - very light and floaty
+        drag_factor = 0.94   # High drag - ice crystals slow down quickly
+        gravity_dv = 15 * dt # Very light gravity - ice crystals float more than fall
+        
+        # Drop expired ice crystals in one O(n) pass, then step the survivors
+        self.comets = comets = [comet for comet in self.comets if age_base - comet.t <= comet.life]
+        for comet in comets:
             # Update position based on velocity
             comet.x += comet.vx * dt
             comet.y += comet.vy * dt
             
-            # Ice crystal physics - very light and floaty
-            drag_factor = 0.94  # High drag - ice crystals slow down quickly
+            # Drag, then gravity
             comet.vx *= drag_factor
-            comet.vy *= drag_factor
-            
-            # Very light gravity - ice crystals float more than fall
-            comet.vy += 15 * dt  # Very light gravity
+            comet.vy = comet.vy * drag_factor + gravity_dv
             
             # Add slight random drift for natural ice crystal movement
-            import random
-            comet.vx += random.uniform(-2, 2) * dt
-            comet.vy += random.uniform(-1, 1) * dt
-        
-        # Remove expired comets (in reverse order to maintain indices)
-        for i in reversed(comets_to_remove):
-            del self.comets[i]
+            comet.vx += _uniform(-2, 2) * dt
+            comet.vy += _uniform(-1, 1) * dt
 
     def _age_to_fade_and_color(self, age: float):
         life = max(0.0, min(1.0, age / self.cfg.fade_seconds))
         fade = 1.0 - life
         fade = math.pow(fade, 1/self.cfg.fade_slowdown)
         
+        # Color comes from the precomputed gradient (callers copy before changing alpha)
+        return fade, self._gradient_lut[int(life * (GRADIENT_LUT_SIZE - 1) + 0.5)]
+
+    def _gradient_color(self, life: float) -> QtGui.QColor:
+        """Interpolate the trail color at a life fraction (0 = new, 1 = fully faded)."""
         # Handle different numbers of colors based on the dropdown selection
         if self.cfg.num_colors == 1:
             # Single color: no gradient
-            color = self.cfg.color_start
+            color = QtGui.QColor(self.cfg.color_start)
         elif self.cfg.num_colors == 2:
             # Two colors: simple gradient from start to end
             start_color = self.cfg.color_start
@@ -1288,7 +1444,7 @@ class Overlay(QtWidgets.QWidget):
             b = int(color1.blue()  + (color2.blue()  - color1.blue())  * t)
             color = QtGui.QColor(r, g, b)
         
-        return fade, color
+        return color
 
     def _set_pens_for_age(self, painter: QtGui.QPainter, age: float):
         fade, col = self._age_to_fade_and_color(age)
@@ -1365,83 +1521,71 @@ class Overlay(QtWidgets.QWidget):
 
     def _draw_fat_start_cap(self, painter: QtGui.QPainter, start_point: QtCore.QPointF, age: float):
         """Draw a fat rounded cap at the very start of the trail."""
-        fade, col = self._age_to_fade_and_color(age)
-        if fade <= 0.0: return
-        
-        # Draw glow layers first if glow is enabled (same as trail)
-        if self.cfg.glow_percent > 0:
-            num_layers = self.cfg.gradient_layers
-            
-            # Draw gradient circles from outside to inside (glow)
-            for i in range(num_layers):
-                # Calculate radius for this glow layer (matches trail glow system)
-                layer_ratio = (num_layers - i) / num_layers  # 1.0 to 1/num_layers
-                min_glow_radius = (self.cfg.core_width + 1) / 2  # Start glow just outside core
-                radius = min_glow_radius + ((self.cfg.glow_width / 2) - min_glow_radius) * layer_ratio
-                
-                # Calculate alpha for glow (same as trail glow)
-                alpha = int(fade * (80 - (layer_ratio * 70)))  # Fade from 80 to 10
-                
-                # Create color for this glow layer
-                glow_color = QtGui.QColor(col)
-                glow_color.setAlpha(alpha)
-                
-                painter.setBrush(QtGui.QBrush(glow_color))
-                painter.setPen(QtCore.Qt.NoPen)
-                
-                # Draw full circle for glow
-                painter.drawEllipse(start_point, radius, radius)
-        
-        # Draw fat core cap on top (5% smaller)
-        core_radius = (self.cfg.core_width / 2) * 0.95  # 5% smaller than full core width
-        core_color = QtGui.QColor(col)
-        core_color.setAlpha(int(fade * 255))  # Full opacity for core
-        
-        painter.setBrush(QtGui.QBrush(core_color))
-        painter.setPen(QtCore.Qt.NoPen)
-        
-        # Draw fat core circle
-        painter.drawEllipse(start_point, core_radius, core_radius)
+        self._draw_cap_stamp(painter, start_point, age)
 
     def _draw_fat_end_cap(self, painter: QtGui.QPainter, end_point: QtCore.QPointF, age: float):
         """Draw a fat rounded cap at the very end of the trail."""
+        self._draw_cap_stamp(painter, end_point, age)
+
+    def _draw_cap_stamp(self, painter: QtGui.QPainter, center: QtCore.QPointF, age: float):
+        """Blit the pre-rendered cap (glow rings + core disc) for this age centered on a trail end."""
         fade, col = self._age_to_fade_and_color(age)
-        if fade <= 0.0: return
+        level = int(fade * CAP_FADE_LEVELS + 0.5)  # Quantized so a handful of stamps cover the whole fade
+        if level <= 0: return
+        stamp = self._cap_stamp(col, level)
+        half = stamp.width() / stamp.devicePixelRatio() / 2
+        painter.drawPixmap(QtCore.QPointF(center.x() - half, center.y() - half), stamp)
+
+    def _cap_stamp(self, col: QtGui.QColor, level: int) -> QtGui.QPixmap:
+        """Cap pixmap for a color and fade level, rendered once and kept in QPixmapCache.
+        
+        The key holds everything the drawing depends on, so config changes simply
+        miss the cache and stale stamps age out.
+        """
+        cfg = self.cfg
+        glow = cfg.glow_percent > 0
+        dpr = self.devicePixelRatioF()
+        key = f"graftrail-cap-{col.rgb():x}-{level}-{cfg.core_width}-{cfg.glow_width if glow else 0}-{cfg.gradient_layers}-{dpr}"
+        stamp = QtGui.QPixmapCache.find(key)
+        if stamp is not None:
+            return stamp
+        
+        fade = level / CAP_FADE_LEVELS
+        core_radius = (cfg.core_width / 2) * 0.95  # 5% smaller than full core width
+        half = math.ceil(max(core_radius, cfg.glow_width / 2 if glow else 0.0)) + 1  # +1 for antialiasing
+        stamp = QtGui.QPixmap(int(2 * half * dpr), int(2 * half * dpr))
+        stamp.setDevicePixelRatio(dpr)
+        stamp.fill(QtCore.Qt.transparent)
+        p = QtGui.QPainter(stamp)
+        p.setRenderHint(QtGui.QPainter.Antialiasing, True)
+        p.setPen(QtCore.Qt.NoPen)
+        c = QtCore.QPointF(half, half)
         
         # Draw glow layers first if glow is enabled (same as trail)
-        if self.cfg.glow_percent > 0:
-            num_layers = self.cfg.gradient_layers
-            
+        if glow:
+            num_layers = cfg.gradient_layers
+            min_glow_radius = (cfg.core_width + 1) / 2  # Start glow just outside core
             # Draw gradient circles from outside to inside (glow)
             for i in range(num_layers):
                 # Calculate radius for this glow layer (matches trail glow system)
                 layer_ratio = (num_layers - i) / num_layers  # 1.0 to 1/num_layers
-                min_glow_radius = (self.cfg.core_width + 1) / 2  # Start glow just outside core
-                radius = min_glow_radius + ((self.cfg.glow_width / 2) - min_glow_radius) * layer_ratio
+                radius = min_glow_radius + ((cfg.glow_width / 2) - min_glow_radius) * layer_ratio
                 
                 # Calculate alpha for glow (same as trail glow)
-                alpha = int(fade * (80 - (layer_ratio * 70)))  # Fade from 80 to 10
-                
-                # Create color for this glow layer
                 glow_color = QtGui.QColor(col)
-                glow_color.setAlpha(alpha)
-                
-                painter.setBrush(QtGui.QBrush(glow_color))
-                painter.setPen(QtCore.Qt.NoPen)
-                
-                # Draw full circle for glow
-                painter.drawEllipse(end_point, radius, radius)
+                glow_color.setAlpha(int(fade * (80 - (layer_ratio * 70))))  # Fade from 80 to 10
+                p.setBrush(QtGui.QBrush(glow_color))
+                p.drawEllipse(c, radius, radius)
         
         # Draw fat core cap on top (5% smaller)
-        core_radius = (self.cfg.core_width / 2) * 0.95  # 5% smaller than full core width
         core_color = QtGui.QColor(col)
         core_color.setAlpha(int(fade * 255))  # Full opacity for core
+        p.setBrush(QtGui.QBrush(core_color))
+        p.drawEllipse(c, core_radius, core_radius)
+        p.end()
         
-        painter.setBrush(QtGui.QBrush(core_color))
-        painter.setPen(QtCore.Qt.NoPen)
-        
-        # Draw fat core circle
-        painter.drawEllipse(end_point, core_radius, core_radius)
+        QtGui.QPixmapCache.insert(key, stamp)
+        return stamp
 
     def _draw_gradient_path_with_caps(self, painter: QtGui.QPainter, path: QtGui.QPainterPath, round_start: bool, round_end: bool):
         """Draw path with solid core stroke and gradient glow layers, with configurable cap styles."""
@@ -1544,10 +1688,10 @@ class Overlay(QtWidgets.QWidget):
     def _draw_sparks(self, painter: QtGui.QPainter, now: float):
         """Draw all active sparks with realistic cooling color transition."""
         painter.setPen(QtCore.Qt.NoPen)
+        age_base = self._age_base(now)
         
         for spark in self.sparks:
-            age = self.get_adjusted_age(spark.t, now)
-            life_ratio = age / spark.life
+            life_ratio = (age_base - spark.t) / spark.life
             
             # Skip if spark is dead
             if life_ratio >= 1.0:
@@ -1557,10 +1701,9 @@ class Overlay(QtWidgets.QWidget):
             lx, ly = self._to_local(spark.x, spark.y)
             
             # Smooth gradient fire colors with randomness: White -> Orange -> Red -> Brown -> Black
-            import random
             
             # Add slight randomness to life_ratio for natural variation
-            random_offset = random.uniform(-0.05, 0.05)  # ±5% variation
+            random_offset = _uniform(-0.05, 0.05)  # ±5% variation
             varied_life = max(0.0, min(1.0, life_ratio + random_offset))
 
             # Add color randomness for natural variation
@@ -1595,9 +1738,9 @@ class Overlay(QtWidgets.QWidget):
                 alpha = int(220 - 100 * t)  # 220 to 120, then fade
             
             
-            r = max(0, min(255, r + random.randint(-color_variation, color_variation)))
-            g = max(0, min(255, g + random.randint(-color_variation, color_variation)))
-            b = max(0, min(255, b + random.randint(-color_variation, color_variation)))
+            r = max(0, min(255, r + _randint(-color_variation, color_variation)))
+            g = max(0, min(255, g + _randint(-color_variation, color_variation)))
+            b = max(0, min(255, b + _randint(-color_variation, color_variation)))
             
             spark_color = QtGui.QColor(r, g, b)
             
@@ -1651,10 +1794,10 @@ class Overlay(QtWidgets.QWidget):
     def _draw_comets(self, painter: QtGui.QPainter, now: float):
         """Draw ice crystal particles trailing behind the cursor."""
         painter.setPen(QtCore.Qt.NoPen)
+        age_base = self._age_base(now)
         
         for comet in self.comets:
-            age = self.get_adjusted_age(comet.t, now)
-            life_ratio = age / comet.life
+            life_ratio = (age_base - comet.t) / comet.life
             
             # Skip if ice crystal is dead
             if life_ratio >= 1.0:
@@ -1702,10 +1845,41 @@ class Overlay(QtWidgets.QWidget):
                 painter.setBrush(QtGui.QBrush(center_color))
                 painter.drawEllipse(QtCore.QPointF(lx, ly), current_size * 0.3, current_size * 0.3)
 
+    def _draw_stroke(self, painter: QtGui.QPainter, segment: List[TrailPoint], age: Optional[float] = None):
+        """Draw one stroke with start/end caps; age overrides the per-point ages when given."""
+        xs, ys, c1x, c1y, c2x, c2y = self._stroke_columns(segment)
+        last = len(segment) - 1
+        age_base = self._age_base(self._now)  # point age = age_base - t
+        
+        # Draw start cap first (underneath the trail)
+        self._draw_fat_start_cap(painter, QtCore.QPointF(xs[0], ys[0]), age_base - segment[0].t if age is None else age)
+        
+        # Draw segments individually for proper color/alpha gradients
+        # but use a stroke-only approach to avoid filling on self-intersecting paths
+        end_visible = False
+        path = QtGui.QPainterPath()  # Reused for every segment; float overloads, no QPointF
+        for k in range(last):
+            seg_age = age_base - segment[k + 1].t if age is None else age
+            fade, _ = self._age_to_fade_and_color(seg_age)
+            if fade <= 0.0: continue
+            path.clear()
+            path.moveTo(xs[k], ys[k])
+            path.cubicTo(c1x[k], c1y[k], c2x[k], c2y[k], xs[k + 1], ys[k + 1])
+            
+            # Draw segments with proper color/alpha gradients
+            self._set_pens_for_age(painter, seg_age)
+            self._draw_gradient_path(painter, path)
+            end_visible = k == last - 1
+        
+        # Add end cap on top of the trail (only if the newest segment was drawn)
+        if end_visible:
+            self._draw_fat_end_cap(painter, QtCore.QPointF(xs[last], ys[last]), age_base - segment[last].t if age is None else age)
+
     # ----- paint -----
     def paintEvent(self, ev: QtGui.QPaintEvent):
         if not self.points and not self.sparks and not self.comets and not self._temp_points: return
         painter = QtGui.QPainter(self)
+        painter.setClipRegion(ev.region())  # Only the dirty area requested by tick()
         painter.setRenderHint(QtGui.QPainter.Antialiasing, True)
 
         # Draw trail
@@ -1714,90 +1888,19 @@ class Overlay(QtWidgets.QWidget):
             while i < n:
                 j = i + 1; sid = pts[i].stroke
                 while j < n and pts[j].stroke == sid: j += 1
-                segment = pts[i:j]
-
-                if len(segment) >= 2:
-                    # Draw segments individually for proper color/alpha gradients
-                    # but use a stroke-only approach to avoid filling on self-intersecting paths
-                    start_point = None
-                    end_point = None
-                    
-                    # Draw start cap first (underneath the trail)
-                    if len(segment) > 0:
-                        start_point = QtCore.QPointF(*self._to_local(segment[0].x, segment[0].y))
-                        self._draw_fat_start_cap(painter, start_point, segment[0].age)
-                    
-                    for k in range(0, len(segment)-1):
-                        p0 = segment[k-1] if k-1 >= 0 else segment[k]
-                        p1 = segment[k]; p2 = segment[k+1]
-                        p3 = segment[k+2] if (k+2) < len(segment) else segment[k+1]
-                        P0 = QtCore.QPointF(*self._to_local(p0.x, p0.y))
-                        P1 = QtCore.QPointF(*self._to_local(p1.x, p1.y))
-                        P2 = QtCore.QPointF(*self._to_local(p2.x, p2.y))
-                        P3 = QtCore.QPointF(*self._to_local(p3.x, p3.y))
-                        C1, C2 = self._catmull_rom_to_bezier(P0, P1, P2, P3, self.cfg.tension)
-                        path = QtGui.QPainterPath(P1); path.cubicTo(C1, C2, P2)
-
-                        age = p2.age
-                        fade, _ = self._age_to_fade_and_color(age)
-                        if fade <= 0.0: continue
-                        
-                        # Draw segments with proper color/alpha gradients
-                        self._set_pens_for_age(painter, age)
-                        self._draw_gradient_path(painter, path)
-                        
-                        # Track end point for end cap
-                        if k == len(segment) - 2:
-                            end_point = P2
-                    
-                    # Add end cap on top of the trail
-                    if end_point and len(segment) > 1:
-                        self._draw_fat_end_cap(painter, end_point, segment[-1].age)
-
-                    # No caps - using rounded corners for the start of first segment instead
-
+                if j - i >= 2:
+                    self._draw_stroke(painter, pts[i:j])
                 i = j
         
         # Draw temporary shape (rectangle/circle) with full trail styling
-        if self._temp_points:
-            temp_pts = self._temp_points
-            if len(temp_pts) >= 2:
-                # Treat temporary points as a single stroke segment
-                segment = temp_pts
-                
-                # Draw start cap first (underneath the trail)
-                if len(segment) > 0:
-                    start_point = QtCore.QPointF(*self._to_local(segment[0].x, segment[0].y))
-                    self._draw_fat_start_cap(painter, start_point, 0.0)  # Age 0 for full opacity
-                
-                # Draw segments with full trail styling (age 0 for full opacity)
-                for k in range(0, len(segment)-1):
-                    p0 = segment[k-1] if k-1 >= 0 else segment[k]
-                    p1 = segment[k]; p2 = segment[k+1]
-                    p3 = segment[k+2] if (k+2) < len(segment) else segment[k+1]
-                    P0 = QtCore.QPointF(*self._to_local(p0.x, p0.y))
-                    P1 = QtCore.QPointF(*self._to_local(p1.x, p1.y))
-                    P2 = QtCore.QPointF(*self._to_local(p2.x, p2.y))
-                    P3 = QtCore.QPointF(*self._to_local(p3.x, p3.y))
-                    C1, C2 = self._catmull_rom_to_bezier(P0, P1, P2, P3, self.cfg.tension)
-                    path = QtGui.QPainterPath(P1); path.cubicTo(C1, C2, P2)
-
-                    # Draw with age 0 for full opacity and color
-                    self._set_pens_for_age(painter, 0.0)
-                    self._draw_gradient_path(painter, path)
-                
-                # Add end cap on top of the trail
-                if len(segment) > 1:
-                    end_point = QtCore.QPointF(*self._to_local(segment[-1].x, segment[-1].y))
-                    self._draw_fat_end_cap(painter, end_point, 0.0)  # Age 0 for full opacity
-        
-        # Draw sparks (thread-safe)
-        with self.particle_lock:
-            self._draw_sparks(painter, time.time())
+        if len(self._temp_points) >= 2:
+            # Treat temporary points as a single stroke, age 0 for full opacity
+            self._draw_stroke(painter, self._temp_points, age=0.0)
         
-        # Draw comets (thread-safe)
-        with self.particle_lock:
-            self._draw_comets(painter, time.time())
+        # Draw sparks and comets
+        real_now = self._now  # Same frame time tick() stepped the particles with
+        self._draw_sparks(painter, real_now)
+        self._draw_comets(painter, real_now)
 
 # ------------------------- Settings dialog -------------------------
 class SettingsDialog(QtWidgets.QDialog):
@@ -1813,6 +1916,12 @@ class SettingsDialog(QtWidgets.QDialog):
         self.setWindowIcon(self._create_settings_icon())
         
         self.cfg = cfg  # live reference
+        
+        # Debounce config_changed so a slider drag saves/applies once per frame, not per step
+        self._change_timer = QtCore.QTimer(self)
+        self._change_timer.setSingleShot(True)
+        self._change_timer.setInterval(16)
+        self._change_timer.timeout.connect(lambda: self.config_changed.emit(self.cfg))
 
         def color_button(initial: QtGui.QColor):
             btn = QtWidgets.QPushButton()
@@ -2221,7 +2330,7 @@ class SettingsDialog(QtWidgets.QDialog):
         self.emit_change()
 
     def emit_change(self):
-        self.config_changed.emit(self.cfg)
+        self._change_timer.start()  # Restarts if already pending
 
     def _create_settings_icon(self):
         """Create the GrafTrail icon for the settings window"""
@@ -2391,6 +2500,8 @@ def main():
     settings = QtCore.QSettings(QtCore.QSettings.UserScope, ORG_NAME, APP_NAME)
     cfg = Config.load(settings)
     overlay = Overlay(cfg); overlay.show()
+    _watch_session_unlock(overlay)
+    _watch_screen_changes(app, overlay.update_geometry)
     tray = Tray(overlay, settings)
     
     # Connect keyboard shortcuts to draw mode changes
@@ -21,29 +21,27 @@
 # BUILD:
 # pyinstaller --noconsole --onefile --name "GrafTrail" overlay.py
 #
-# Requirements: Python 3.9+, PyQt5, pyautogui
+# Requirements: Python 3.9+, PyQt5
 # =====================================================================
 
 # ===================================================================== 
 # IMPORTS
 # =====================================================================
 import sys        # System-specific parameters and functions
-import time       # Time-related functions for timestamps and timing
 import ctypes     # Foreign function library for Windows API calls
 import os         # Operating system interface functions
-from dataclasses import dataclass  # Decorator for creating data classes
-from typing import List, Optional, Tuple  # Type hints for better code documentation
+import array      # Typed arrays for the trail point buffer
+import collections  # Deque for cursor samples from the mouse hook
+import functools  # Caching the generated tray icons
+import itertools  # Iterating the ring buffer across its wrap point
+from typing import Callable, List, Optional, Tuple  # Type hints for better code documentation
 
 # Third-party libraries
-import pyautogui  # Cross-platform mouse and keyboard automation
 from PyQt5 import QtCore, QtGui, QtWidgets  # Qt framework for GUI applications
 
 # Platform-specific imports
 import platform   # Platform detection
 
-# Disable pyautogui's fail-safe (moving mouse to corner doesn't exit)
-pyautogui.FAILSAFE = False
-
 # =====================================================================
 # CONFIGURATION CONSTANTS
 # =====================================================================
@@ -52,20 +50,30 @@ pyautogui.FAILSAFE = False
 # Trail timing and animation
 FADE_SECONDS   = 1.5   # How long trails take to completely fade out
 FRAME_MS       = 16    # Refresh rate (~60 FPS = 16.67ms per frame)
+IDLE_POLL_MS   = 100   # CTRL polling interval while there is no trail (when CTRL can't signal)
+FADE_NS        = int(FADE_SECONDS * 1_000_000_000)  # Fade duration in clock ticks (ns)
+MAX_SAMPLE_HZ  = 1000  # Highest cursor sample rate expected from the mouse hook
 
 # Trail appearance
 CORE_WIDTH     = 17    # Width of the solid center line (pixels)
 GLOW_WIDTH     = 23    # Width of the outer glow effect (pixels)
+DIRTY_MARGIN   = GLOW_WIDTH // 2 + 2  # Padding around the trail when invalidating (pixels)
 
 # Trail quality and smoothing
 MIN_DIST_PX    = 3.5   # Minimum distance between points (reduces noise)
+MIN_DIST_SQ    = MIN_DIST_PX * MIN_DIST_PX  # Squared form, compared against dx*dx + dy*dy
 EMA_ALPHA      = 0.35  # Exponential moving average factor (0-1, higher = more responsive)
 CR_TENSION     = 1.0   # Catmull-Rom spline tension (1.0 = standard, higher = tighter curves)
+CR_K           = CR_TENSION / 6.0  # Catmull-Rom -> Bézier control point scale
+LINE_TO_CUTOFF_SQ = (2 * MIN_DIST_PX) ** 2  # Segments shorter than this are drawn straight
 
 # Color scheme: Orange to Yellow gradient as trail fades
 COLOR_START_RGB = (240, 90, 40)   # Bright orange for fresh trail
 COLOR_END_RGB   = (251, 202, 10)  # Golden yellow for faded trail
 
+# Trail segments are batched into this many age bins when painting
+FADE_BUCKETS    = 32
+
 # Alpha transparency levels (0-255)
 GLOW_ALPHA_MAX  = 110  # Maximum opacity for glow effect
 CORE_ALPHA_MAX  = 230  # Maximum opacity for core trail
@@ -78,13 +86,25 @@ APP_NAME        = "GrafTrail"
 # CROSS-PLATFORM SYSTEM HELPERS
 # =====================================================================
 
+# Platform never changes at runtime, so detect it once at import instead of
+# calling platform.system() from the per-frame CTRL polling path
+_PLATFORM   = platform.system().lower()
+_IS_WINDOWS = _PLATFORM == "windows"
+_IS_MACOS   = _PLATFORM == "darwin"
+
+# Run-at-startup backends, imported once for the platform that uses them
+if _IS_WINDOWS:
+    import winreg     # Registry access for the Run key
+elif _IS_MACOS:
+    import plistlib   # LaunchAgent plist writing
+
 def get_platform() -> str:
     """Get the current platform name in lowercase.
     
     Returns:
         str: 'windows', 'darwin' (macOS), or 'linux'
     """
-    return platform.system().lower()
+    return _PLATFORM
 
 # Windows system metrics constants for multi-monitor setups
 SM_XVIRTUALSCREEN  = 76  # Left edge of virtual screen
@@ -92,51 +112,115 @@ SM_YVIRTUALSCREEN  = 77  # Top edge of virtual screen
 SM_CXVIRTUALSCREEN = 78  # Width of virtual screen
 SM_CYVIRTUALSCREEN = 79  # Height of virtual screen
 
+# Bind the user32 entry points once with explicit signatures so per-frame
+# calls skip the windll attribute chain and ctypes argument inference
+if _IS_WINDOWS:
+    _user32 = ctypes.WinDLL("user32")
+
+    _GetAsyncKeyState = _user32.GetAsyncKeyState
+    _GetAsyncKeyState.argtypes = [ctypes.c_int]
+    _GetAsyncKeyState.restype = ctypes.c_short   # High bit set -> negative value
+
+    _GetSystemMetrics = _user32.GetSystemMetrics
+    _GetSystemMetrics.argtypes = [ctypes.c_int]
+    _GetSystemMetrics.restype = ctypes.c_int
+
 # Platform-specific global state for CTRL key tracking
 _ctrl_pressed = False
 _key_monitor = None
 
+# Cached virtual desktop rectangle (cleared when monitors are added/removed)
+_vrect_cache: Optional[QtCore.QRect] = None
+
 def virtual_rect() -> QtCore.QRect:
     """Get the bounding rectangle that encompasses all monitors.
     
     This ensures the overlay covers the entire desktop area, including
     multiple monitors with different resolutions and arrangements.
-    Works cross-platform using Qt's desktop widget on macOS/Linux and
-    Windows API on Windows for optimal performance.
+    The result only changes when displays are reconfigured, so it is
+    cached and invalidated by the screen signals hooked up in
+    _watch_screen_changes().
     
     Returns:
         QtCore.QRect: Rectangle covering all connected displays
     """
-    current_platform = get_platform()
+    global _vrect_cache
+    if _vrect_cache is None:
+        if not _IS_WINDOWS and QtWidgets.QApplication.instance() is None:
+            # Don't cache the fallback used before QApplication exists
+            return _query_virtual_rect()
+        _vrect_cache = _query_virtual_rect()
+    return QtCore.QRect(_vrect_cache)
+
+def _invalidate_virtual_rect(*_):
+    """Drop the cached virtual desktop rectangle (display configuration changed)."""
+    global _vrect_cache
+    _vrect_cache = None
+
+def _watch_screen_changes(app: QtWidgets.QApplication, on_change: Optional[Callable[[], None]] = None):
+    """Connect Qt's screen hotplug signals to the virtual rectangle cache.
+    
+    Args:
+        app (QApplication): The running application instance
+        on_change (callable, optional): Called after the cache is dropped,
+            e.g. to move the overlay onto the new desktop
+    """
+    def changed(*_):
+        # Display configuration changed: drop the cache, then notify
+        _invalidate_virtual_rect()
+        if on_change is not None:
+            on_change()
+
+    def watch(screen: QtGui.QScreen):
+        # A screen being resized or moved changes the desktop too
+        screen.geometryChanged.connect(changed)
+
+    def added(screen: QtGui.QScreen):
+        watch(screen)
+        changed()
+
+    app.screenAdded.connect(added)
+    app.screenRemoved.connect(changed)
+    for screen in app.screens():
+        watch(screen)
+
+def _query_virtual_rect() -> QtCore.QRect:
+    """Query the OS for the virtual desktop rectangle (uncached).
     
-    if current_platform == "windows":
+    Works cross-platform using QGuiApplication.screens() on macOS/Linux and
+    Windows API on Windows for optimal performance.
+    
+    Returns:
+        QtCore.QRect: Rectangle covering all connected displays
+    """
+    if _IS_WINDOWS:
         # Use Windows API for precise multi-monitor support
-        u32 = ctypes.windll.user32
         return QtCore.QRect(
-            u32.GetSystemMetrics(SM_XVIRTUALSCREEN),   # X position of virtual screen
-            u32.GetSystemMetrics(SM_YVIRTUALSCREEN),   # Y position of virtual screen
-            u32.GetSystemMetrics(SM_CXVIRTUALSCREEN),  # Total width of all monitors
-            u32.GetSystemMetrics(SM_CYVIRTUALSCREEN),  # Total height of all monitors
+            _GetSystemMetrics(SM_XVIRTUALSCREEN),   # X position of virtual screen
+            _GetSystemMetrics(SM_YVIRTUALSCREEN),   # Y position of virtual screen
+            _GetSystemMetrics(SM_CXVIRTUALSCREEN),  # Total width of all monitors
+            _GetSystemMetrics(SM_CYVIRTUALSCREEN),  # Total height of all monitors
         )
     else:
-        # Use Qt's cross-platform desktop widget for macOS/Linux
-        app = QtWidgets.QApplication.instance()
-        if app is None:
-            # Fallback if no QApplication exists yet
+        # Union of all screen geometries for macOS/Linux
+        screens = QtGui.QGuiApplication.screens() if QtWidgets.QApplication.instance() else []
+        if not screens:
+            # Fallback if no QApplication (or no screen) exists yet
             return QtCore.QRect(0, 0, 1920, 1080)
-            
-        desktop = app.desktop()
         
-        # Calculate bounding rectangle for all screens
-        screen_count = desktop.screenCount()
-        if screen_count == 1:
-            return desktop.screenGeometry(0)
-        
-        # Multi-monitor: find bounding rectangle
-        left = min(desktop.screenGeometry(i).left() for i in range(screen_count))
-        top = min(desktop.screenGeometry(i).top() for i in range(screen_count))
-        right = max(desktop.screenGeometry(i).right() for i in range(screen_count))
-        bottom = max(desktop.screenGeometry(i).bottom() for i in range(screen_count))
+        # Single pass: one geometry() fetch per screen
+        g = screens[0].geometry()
+        left, top, right, bottom = g.left(), g.top(), g.right(), g.bottom()
+        for screen in screens[1:]:
+            g = screen.geometry()
+            if g.left() < left:
+                left = g.left()
+            if g.top() < top:
+                top = g.top()
+            if g.right() > right:
+                right = g.right()
+            if g.bottom() > bottom:
+                bottom = g.bottom()
         
         return QtCore.QRect(left, top, right - left + 1, bottom - top + 1)
 
@@ -144,33 +228,259 @@ def virtual_rect() -> QtCore.QRect:
 VK_LCONTROL = 0xA2  # Left Control key
 VK_RCONTROL = 0xA3  # Right Control key
 
+# Low-level keyboard hook constants (Windows)
+WH_KEYBOARD_LL = 13      # Hook type for global low-level keyboard events
+HC_ACTION      = 0       # Hook code: event carries key data
+WM_KEYDOWN     = 0x0100  # Key pressed
+WM_KEYUP       = 0x0101  # Key released
+WM_SYSKEYDOWN  = 0x0104  # Key pressed while ALT is held
+WM_SYSKEYUP    = 0x0105  # Key released while ALT is held
+WH_MOUSE_LL    = 14      # Hook type for global low-level mouse events
+WM_MOUSEMOVE   = 0x0200  # Cursor moved
+
+# Installed hook handle and bitmask of CTRL keys currently held (bit 0 = left, bit 1 = right)
+_keyboard_hook = None
+_ctrl_mask = 0
+
+# Installed mouse hook handle and cursor positions it recorded while CTRL was held;
+# the hook is only installed for the duration of a stroke
+_mouse_hook = None
+_mouse_hook_enabled = False
+_cursor_samples = collections.deque(maxlen=128)
+
+if _IS_WINDOWS:
+    from ctypes import wintypes
+
+    class KBDLLHOOKSTRUCT(ctypes.Structure):
+        """Key event data passed to a WH_KEYBOARD_LL hook procedure."""
+        _fields_ = [
+            ("vkCode",      wintypes.DWORD),
+            ("scanCode",    wintypes.DWORD),
+            ("flags",       wintypes.DWORD),
+            ("time",        wintypes.DWORD),
+            ("dwExtraInfo", ctypes.c_size_t),  # ULONG_PTR
+        ]
+
+    HOOKPROC = ctypes.WINFUNCTYPE(wintypes.LPARAM, ctypes.c_int, wintypes.WPARAM, wintypes.LPARAM)
+
+    _SetWindowsHookExW = _user32.SetWindowsHookExW
+    _SetWindowsHookExW.argtypes = [ctypes.c_int, HOOKPROC, wintypes.HINSTANCE, wintypes.DWORD]
+    _SetWindowsHookExW.restype = wintypes.HHOOK
+
+    _CallNextHookEx = _user32.CallNextHookEx
+    _CallNextHookEx.argtypes = [wintypes.HHOOK, ctypes.c_int, wintypes.WPARAM, wintypes.LPARAM]
+    _CallNextHookEx.restype = wintypes.LPARAM
+
+    _UnhookWindowsHookEx = _user32.UnhookWindowsHookEx
+    _UnhookWindowsHookEx.argtypes = [wintypes.HHOOK]
+    _UnhookWindowsHookEx.restype = wintypes.BOOL
+
+    _GetModuleHandleW = ctypes.WinDLL("kernel32").GetModuleHandleW
+    _GetModuleHandleW.argtypes = [wintypes.LPCWSTR]
+    _GetModuleHandleW.restype = wintypes.HMODULE
+
+    def _keyboard_hook_proc(n_code, w_param, l_param):
+        """Track CTRL transitions from the global low-level keyboard hook.
+        
+        Windows calls this on the GUI thread (the thread that installed the
+        hook) while Qt pumps its message loop, so only key edges cost any work.
+        """
+        global _ctrl_pressed, _ctrl_mask
+        if n_code == HC_ACTION:
+            vk = ctypes.cast(l_param, ctypes.POINTER(KBDLLHOOKSTRUCT))[0].vkCode
+            if vk == VK_LCONTROL or vk == VK_RCONTROL:
+                bit = 1 if vk == VK_LCONTROL else 2
+                if w_param == WM_KEYDOWN or w_param == WM_SYSKEYDOWN:
+                    _ctrl_mask |= bit
+                elif w_param == WM_KEYUP or w_param == WM_SYSKEYUP:
+                    _ctrl_mask &= ~bit
+                pressed = _ctrl_mask != 0
+                if pressed != _ctrl_pressed:
+                    _ctrl_pressed = pressed
+                    if _key_monitor:
+                        _key_monitor.set_ctrl(pressed)
+        return _CallNextHookEx(None, n_code, w_param, l_param)
+
+    # Keep a reference to the ctypes callback for the lifetime of the hook
+    _keyboard_hook_proc_ptr = HOOKPROC(_keyboard_hook_proc)
+
+    class MSLLHOOKSTRUCT(ctypes.Structure):
+        """Mouse event data passed to a WH_MOUSE_LL hook procedure."""
+        _fields_ = [
+            ("pt",          wintypes.POINT),
+            ("mouseData",   wintypes.DWORD),
+            ("flags",       wintypes.DWORD),
+            ("time",        wintypes.DWORD),
+            ("dwExtraInfo", ctypes.c_size_t),  # ULONG_PTR
+        ]
+
+    def _mouse_hook_proc(n_code, w_param, l_param):
+        """Record cursor moves while CTRL is held, at the mouse's own rate.
+        
+        Runs on the GUI thread like the keyboard hook, so every mouse event in
+        the system waits for it. That is why the hook is only installed while
+        a stroke is being drawn (see start_cursor_sampling), and anything but
+        a CTRL-held move returns straight away.
+        """
+        if n_code == HC_ACTION and w_param == WM_MOUSEMOVE and _ctrl_pressed:
+            pt = ctypes.cast(l_param, ctypes.POINTER(MSLLHOOKSTRUCT))[0].pt
+            _cursor_samples.append((pt.x, pt.y))
+        return _CallNextHookEx(None, n_code, w_param, l_param)
+
+    _mouse_hook_proc_ptr = HOOKPROC(_mouse_hook_proc)
+
+    _GetCursorPos = _user32.GetCursorPos
+    _GetCursorPos.argtypes = [ctypes.POINTER(wintypes.POINT)]
+    _GetCursorPos.restype = wintypes.BOOL
+
+    # Reused output buffer for GetCursorPos (GUI thread only)
+    _cursor_pt = wintypes.POINT()
+    _cursor_pt_ref = ctypes.byref(_cursor_pt)
+
+def _install_keyboard_hook() -> bool:
+    """Install the global WH_KEYBOARD_LL hook used for CTRL tracking (Windows).
+    
+    Returns:
+        bool: True if the hook is active, False to keep polling GetAsyncKeyState
+    """
+    global _keyboard_hook, _ctrl_pressed, _ctrl_mask
+    if _keyboard_hook:
+        return True
+    
+    # Seed the state in case CTRL is already held when the hook goes in
+    _ctrl_mask = (1 if _GetAsyncKeyState(VK_LCONTROL) < 0 else 0) | \
+                 (2 if _GetAsyncKeyState(VK_RCONTROL) < 0 else 0)
+    _ctrl_pressed = _ctrl_mask != 0
+    
+    _keyboard_hook = _SetWindowsHookExW(WH_KEYBOARD_LL, _keyboard_hook_proc_ptr,
+                                        _GetModuleHandleW(None), 0)
+    return bool(_keyboard_hook)
+
+def _remove_keyboard_hook():
+    """Uninstall the global keyboard hook if one is active."""
+    global _keyboard_hook
+    if _keyboard_hook:
+        _UnhookWindowsHookEx(_keyboard_hook)
+        _keyboard_hook = None
+
+def _install_mouse_hook() -> bool:
+    """Install the global WH_MOUSE_LL hook that records cursor moves (Windows).
+    
+    Relies on the keyboard hook for CTRL state, so install that first.
+    
+    Returns:
+        bool: True if the hook is active, False to keep polling the cursor
+    """
+    global _mouse_hook
+    if not _mouse_hook:
+        _mouse_hook = _SetWindowsHookExW(WH_MOUSE_LL, _mouse_hook_proc_ptr,
+                                         _GetModuleHandleW(None), 0)
+    return bool(_mouse_hook)
+
+def _remove_mouse_hook():
+    """Uninstall the global mouse hook if one is active."""
+    global _mouse_hook
+    if _mouse_hook:
+        _UnhookWindowsHookEx(_mouse_hook)
+        _mouse_hook = None
+    _cursor_samples.clear()
+
+def cursor_pos() -> Tuple[int, int]:
+    """Get the current mouse position in global screen coordinates.
+    
+    On Windows this calls GetCursorPos directly into a preallocated POINT,
+    the same coordinates the mouse hook and GetSystemMetrics use. Other
+    platforms ask Qt.
+    
+    Returns:
+        Tuple[int, int]: Cursor (x, y)
+    """
+    if _IS_WINDOWS:
+        _GetCursorPos(_cursor_pt_ref)
+        return _cursor_pt.x, _cursor_pt.y
+    pos = QtGui.QCursor.pos()
+    return pos.x(), pos.y()
+
+def hook_records_cursor() -> bool:
+    """Check whether strokes are sampled by the mouse hook rather than polled."""
+    return _mouse_hook_enabled
+
+def start_cursor_sampling():
+    """Install the mouse hook for a new stroke (Windows with the keyboard hook).
+    
+    Keeping the hook out while CTRL is up means mouse input elsewhere on the
+    desktop never waits on Python. If the install fails, or Windows later
+    drops the hook, take_cursor_samples() returns None and the cursor is
+    polled instead.
+    """
+    if _mouse_hook_enabled:
+        _install_mouse_hook()
+
+def stop_cursor_sampling():
+    """Remove the mouse hook at the end of a stroke."""
+    _remove_mouse_hook()
+
+def take_cursor_samples() -> Optional[List[Tuple[int, int]]]:
+    """Collect the cursor positions recorded since the last call.
+    
+    Returns:
+        List[Tuple[int, int]] or None: Positions in order (possibly empty),
+            or None when no mouse hook is recording and the caller should
+            poll the cursor instead
+    """
+    if not _mouse_hook:
+        return None
+    samples = list(_cursor_samples)
+    _cursor_samples.clear()
+    return samples
+
 class GlobalKeyMonitor(QtCore.QObject):
     """Cross-platform global key state monitor using Qt events.
     
     This class provides a fallback for platforms where low-level
-    key monitoring is not easily available.
+    key monitoring is not easily available. On Windows it only relays
+    edges reported by the keyboard hook.
+    
+    Signals:
+        ctrl_changed (bool): Emitted when CTRL is pressed or released
     """
+    ctrl_changed = QtCore.pyqtSignal(bool)  # Signal for CTRL edges
     
     def __init__(self):
         super().__init__()
         self.ctrl_pressed = False
         
+    def set_ctrl(self, pressed: bool):
+        """Record the CTRL state and notify listeners on a transition."""
+        if pressed != self.ctrl_pressed:
+            self.ctrl_pressed = pressed
+            self.ctrl_changed.emit(pressed)
+        
     def eventFilter(self, obj, event):
         """Qt event filter to track CTRL key state globally."""
         if event.type() == QtCore.QEvent.KeyPress:
             if event.key() == QtCore.Qt.Key_Control:
-                self.ctrl_pressed = True
+                self.set_ctrl(True)
         elif event.type() == QtCore.QEvent.KeyRelease:
             if event.key() == QtCore.Qt.Key_Control:
-                self.ctrl_pressed = False
+                self.set_ctrl(False)
         return False  # Don't consume the event
 
 def _init_key_monitor():
     """Initialize platform-specific key monitoring."""
-    global _key_monitor
-    current_platform = get_platform()
+    global _key_monitor, _mouse_hook_enabled
     
-    if current_platform != "windows":
+    if _IS_WINDOWS:
+        # Event-driven CTRL tracking; ctrl_down() polls if the hook fails
+        if _install_keyboard_hook():
+            _key_monitor = GlobalKeyMonitor()  # Relays hook edges as ctrl_changed
+            _key_monitor.ctrl_pressed = _ctrl_pressed
+            _mouse_hook_enabled = True  # Cursor moves between frames, hooked per stroke
+            app = QtWidgets.QApplication.instance()
+            if app:
+                app.aboutToQuit.connect(_remove_mouse_hook)
+                app.aboutToQuit.connect(_remove_keyboard_hook)
+    else:
         # Use Qt-based monitoring for non-Windows platforms
         _key_monitor = GlobalKeyMonitor()
         app = QtWidgets.QApplication.instance()
@@ -181,20 +491,21 @@ def ctrl_down() -> bool:
     """Check if either CTRL key is currently pressed.
     
     Uses platform-appropriate method:
-    - Windows: GetAsyncKeyState API (works without focus)
+    - Windows: low-level keyboard hook state, or GetAsyncKeyState API
+      if the hook could not be installed (both work without focus)
     - macOS/Linux: Qt event monitoring (requires app focus)
     
     Returns:
         bool: True if either left or right CTRL key is pressed
     """
-    current_platform = get_platform()
-    
-    if current_platform == "windows":
-        # Use Windows API for precise, focus-independent detection
-        u32 = ctypes.windll.user32
-        # Check high bit (0x8000) which indicates key is currently pressed
-        return bool((u32.GetAsyncKeyState(VK_LCONTROL) & 0x8000) or
-                    (u32.GetAsyncKeyState(VK_RCONTROL) & 0x8000))
+    if _IS_WINDOWS:
+        if _keyboard_hook:
+            # Maintained by _keyboard_hook_proc on key transitions
+            return _ctrl_pressed
+        # Use Windows API for precise, focus-independent detection.
+        # The high bit (0x8000) means "currently pressed"; with a c_short
+        # return type that is simply the sign bit.
+        return _GetAsyncKeyState(VK_LCONTROL) < 0 or _GetAsyncKeyState(VK_RCONTROL) < 0
     else:
         # Use Qt-based monitoring for macOS/Linux
         global _key_monitor
@@ -212,24 +523,60 @@ def ctrl_down() -> bool:
         
         return False
 
+def recheck_ctrl_release():
+    """Release CTRL if the keyboard hook missed its key-up (Windows).
+    
+    The hook only sees key events on the user's desktop: a release that
+    happens on the secure desktop (Ctrl+Alt+Del, Win+L, a UAC prompt) or
+    after Windows has timed the hook out never arrives, which would leave
+    CTRL held forever. While the hook reports CTRL down, the frame tick
+    calls this to drop any key GetAsyncKeyState says is really up.
+    """
+    global _ctrl_pressed, _ctrl_mask
+    if not (_keyboard_hook and _ctrl_mask):
+        return
+    actual = (1 if _GetAsyncKeyState(VK_LCONTROL) < 0 else 0) | \
+             (2 if _GetAsyncKeyState(VK_RCONTROL) < 0 else 0)
+    _ctrl_mask &= actual  # Only clear; presses still come from the hook
+    if not _ctrl_mask:
+        _ctrl_pressed = False
+        if _key_monitor:
+            _key_monitor.set_ctrl(False)
+
+def ctrl_edge_source() -> Optional[GlobalKeyMonitor]:
+    """Get the monitor that reports CTRL transitions, if there is one.
+    
+    Returns:
+        GlobalKeyMonitor or None: Emits ctrl_changed on every CTRL edge, or
+            None when CTRL can only be polled (Windows without the hook)
+    """
+    return _key_monitor
+
 # =====================================================================
 # CROSS-PLATFORM STARTUP INTEGRATION
 # =====================================================================
 
+_exe_path: Optional[str] = None  # Resolved once; fixed for the process lifetime
+
 def exe_path_for_run():
     """Get the appropriate executable path for startup registration.
     
     When built with PyInstaller, sys.frozen is True and we use the .exe path.
-    During development, we use the Python script path.
+    During development, we use the Python script path. The result is cached
+    since neither can change while the process runs.
     
     Returns:
         str: Full path to executable or script file
     """
-    if getattr(sys, "frozen", False):
-        # Running as PyInstaller executable
-        return sys.executable
-    # Running as Python script
-    return os.path.abspath(sys.argv[0])
+    global _exe_path
+    if _exe_path is None:
+        if getattr(sys, "frozen", False):
+            # Running as PyInstaller executable
+            _exe_path = sys.executable
+        else:
+            # Running as Python script
+            _exe_path = os.path.abspath(sys.argv[0])
+    return _exe_path
 
 def set_run_at_startup(enable: bool):
     """Enable or disable automatic startup with the operating system.
@@ -245,15 +592,13 @@ def set_run_at_startup(enable: bool):
     Returns:
         bool: True if operation succeeded, False if failed
     """
-    current_platform = get_platform()
-    
     try:
-        if current_platform == "windows":
+        if _IS_WINDOWS:
             # Windows Registry method
-            import winreg
             run_key = r"Software\Microsoft\Windows\CurrentVersion\Run"
             
-            with winreg.OpenKey(winreg.HKEY_CURRENT_USER, run_key, 0, winreg.KEY_ALL_ACCESS) as k:
+            # SetValueEx and DeleteValue only need KEY_SET_VALUE access
+            with winreg.OpenKey(winreg.HKEY_CURRENT_USER, run_key, 0, winreg.KEY_SET_VALUE) as k:
                 if enable:
                     winreg.SetValueEx(k, APP_NAME, 0, winreg.REG_SZ, exe_path_for_run())
                 else:
@@ -263,10 +608,8 @@ def set_run_at_startup(enable: bool):
                         pass  # Entry didn't exist, that's fine
             return True
             
-        elif current_platform == "darwin":
+        elif _IS_MACOS:
             # macOS LaunchAgent method
-            import plistlib
-            
             launch_agents_dir = os.path.expanduser("~/Library/LaunchAgents")
             plist_path = os.path.join(launch_agents_dir, f"com.{APP_NAME.lower()}.plist")
             
@@ -338,19 +681,16 @@ def is_run_at_startup():
     Returns:
         bool: True if startup is enabled, False otherwise
     """
-    current_platform = get_platform()
-    
     try:
-        if current_platform == "windows":
+        if _IS_WINDOWS:
             # Windows Registry method
-            import winreg
             run_key = r"Software\Microsoft\Windows\CurrentVersion\Run"
             
             with winreg.OpenKey(winreg.HKEY_CURRENT_USER, run_key, 0, winreg.KEY_READ) as k:
                 val, _ = winreg.QueryValueEx(k, APP_NAME)
                 return bool(val)  # Return True if entry exists and has a value
                 
-        elif current_platform == "darwin":
+        elif _IS_MACOS:
             # macOS LaunchAgent method
             plist_path = os.path.expanduser(f"~/Library/LaunchAgents/com.{APP_NAME.lower()}.plist")
             return os.path.exists(plist_path)
@@ -364,24 +704,199 @@ def is_run_at_startup():
         # Any platform-specific operation failed or entry doesn't exist
         return False
 
+# =====================================================================
+# COLOR LOOKUP TABLES
+# =====================================================================
+# The trail gradient and fade only depend on age, so the pen colors are
+# precomputed once instead of interpolated and allocated every frame.
+
+LUT_SIZE = 256  # Number of quantized age steps across FADE_NS
+
+def _build_color_lut(alpha_max: int) -> List[QtGui.QColor]:
+    """Precompute trail colors for every quantized age step.
+    
+    Entry i corresponds to life = i / (LUT_SIZE - 1): the color is
+    interpolated from COLOR_START_RGB to COLOR_END_RGB and the alpha fades
+    linearly from alpha_max to 0.
+    
+    Args:
+        alpha_max (int): Opacity of a freshly drawn point (0-255)
+        
+    Returns:
+        List[QColor]: LUT_SIZE colors ordered from newest to oldest
+    """
+    r0, g0, b0 = COLOR_START_RGB  # Orange (new)
+    r1, g1, b1 = COLOR_END_RGB    # Yellow (old)
+    lut = []
+    for i in range(LUT_SIZE):
+        life = i / (LUT_SIZE - 1)
+        lut.append(QtGui.QColor(int(r0 + (r1 - r0) * life),
+                                int(g0 + (g1 - g0) * life),
+                                int(b0 + (b1 - b0) * life),
+                                int((1.0 - life) * alpha_max)))
+    return lut
+
+_GLOW_LUT = _build_color_lut(GLOW_ALPHA_MAX)  # Glow pen colors by age step
+_CORE_LUT = _build_color_lut(CORE_ALPHA_MAX)  # Core pen colors by age step
+
+CAP_SPRITE_SIZE = GLOW_WIDTH // 2 * 2 + 2  # Round cap sprite edge (glow disc + AA fringe)
+
+def _lut_index(age: int) -> int:
+    """Map an age in nanoseconds to its color lookup table index."""
+    if age <= 0:
+        return 0
+    return min(LUT_SIZE - 1, age * (LUT_SIZE - 1) // FADE_NS)
+
 # =====================================================================
 # DATA STRUCTURES
 # =====================================================================
 
-@dataclass
-class TrailPoint:
-    """Represents a single point in the mouse trail.
+class TrailBuffer:
+    """Fixed-capacity ring buffer of trail points, oldest first.
+    
+    Each field lives in its own preallocated typed array (struct-of-arrays),
+    so adding a point writes a few numbers in place instead of allocating a
+    Python object per sample. Logical index 0 is the oldest live point;
+    slot() maps a logical index to the physical array position. When full,
+    appending overwrites the oldest point.
     
     Attributes:
-        x (int): Screen X coordinate
-        y (int): Screen Y coordinate  
-        t (float): Timestamp when point was created
-        stroke (int): Stroke ID to group connected points
+        x, y (array[float]): Widget-local coordinates
+        t (array[int]): Monotonic timestamps when points were created (nanoseconds)
+        stroke (array[int]): Stroke IDs to group connected points
+        c1x, c1y, c2x, c2y (array[float]): Bézier control points of the curve
+            segment ending at each point (degenerate for the first point of a stroke)
+        line (array[int]): 1 where the segment ending at the point is drawn as
+            a straight line instead of a cubic
     """
-    x: int      # Screen X coordinate
-    y: int      # Screen Y coordinate
-    t: float    # Timestamp (time.time())
-    stroke: int # Stroke identifier for grouping points
+    __slots__ = ("capacity", "x", "y", "t", "stroke",
+                 "c1x", "c1y", "c2x", "c2y", "line", "head", "size")
+
+    def __init__(self, capacity: int):
+        self.capacity = capacity
+        self.x = array.array("d", bytes(8 * capacity))
+        self.y = array.array("d", bytes(8 * capacity))
+        self.t = array.array("q", bytes(8 * capacity))
+        self.stroke = array.array("q", bytes(8 * capacity))
+        self.c1x = array.array("d", bytes(8 * capacity))
+        self.c1y = array.array("d", bytes(8 * capacity))
+        self.c2x = array.array("d", bytes(8 * capacity))
+        self.c2y = array.array("d", bytes(8 * capacity))
+        self.line = array.array("b", bytes(capacity))
+        self.head = 0  # Physical slot of the oldest point
+        self.size = 0  # Number of live points
+
+    def __len__(self):
+        return self.size
+
+    def slot(self, i: int) -> int:
+        """Map a logical index (negative counts from the newest) to a slot."""
+        if i < 0:
+            i += self.size
+        return (self.head + i) % self.capacity
+
+    def slots(self, lo: int = 0, hi: Optional[int] = None):
+        """Iterate the physical slots of live points lo..hi-1 (logical), oldest first."""
+        if hi is None:
+            hi = self.size
+        cap = self.capacity
+        start = (self.head + lo) % cap
+        end = start + (hi - lo)
+        if end <= cap:
+            return range(start, end)
+        return itertools.chain(range(start, cap), range(0, end - cap))
+
+    def spans(self, arr, lo: int = 0, hi: Optional[int] = None):
+        """Return one field array's values for live points lo..hi-1 as up to two slices."""
+        if hi is None:
+            hi = self.size
+        cap = self.capacity
+        start = (self.head + lo) % cap
+        end = start + (hi - lo)
+        if end <= cap:
+            return (arr[start:end],)
+        return (arr[start:], arr[:end - cap])
+
+    def stroke_ranges(self) -> List[Tuple[int, int]]:
+        """Split the live points into one logical (lo, hi) range per stroke.
+        
+        Stroke IDs never decrease from head to tail, so each boundary is
+        found with a binary search rather than by visiting every point.
+        """
+        S, head, cap, n = self.stroke, self.head, self.capacity, self.size
+        ranges = []
+        lo = 0
+        while lo < n:
+            sid = S[(head + lo) % cap]
+            a, b = lo + 1, n
+            while a < b:
+                mid = (a + b) // 2
+                if S[(head + mid) % cap] == sid:
+                    a = mid + 1
+                else:
+                    b = mid
+            ranges.append((lo, a))
+            lo = a
+        return ranges
+
+    def append(self, x: float, y: float, t: int, stroke: int) -> int:
+        """Add a point as the newest entry and return its slot.
+        
+        Control points start degenerate (at the point itself).
+        """
+        if self.size == self.capacity:
+            self.popleft()
+        i = (self.head + self.size) % self.capacity
+        self.x[i] = self.c1x[i] = self.c2x[i] = x
+        self.y[i] = self.c1y[i] = self.c2y[i] = y
+        self.t[i] = t
+        self.stroke[i] = stroke
+        self.size += 1
+        return i
+
+    def translate(self, dx: float, dy: float):
+        """Shift every live point and its control points by (dx, dy)."""
+        X, Y = self.x, self.y
+        C1X, C1Y, C2X, C2Y = self.c1x, self.c1y, self.c2x, self.c2y
+        for i in self.slots():
+            X[i] += dx; Y[i] += dy
+            C1X[i] += dx; C1Y[i] += dy
+            C2X[i] += dx; C2Y[i] += dy
+
+    def popleft(self):
+        """Drop the oldest point."""
+        self.head = (self.head + 1) % self.capacity
+        self.size -= 1
+
+    def first_newer(self, t: int, lo: int = 0, hi: Optional[int] = None) -> int:
+        """Find the first point in logical range lo..hi-1 created after time t.
+        
+        Timestamps increase from head to tail, so this is a binary search.
+        
+        Returns:
+            int: Logical index of that point, or hi if there is none
+        """
+        if hi is None:
+            hi = self.size
+        ts, head, cap = self.t, self.head, self.capacity
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if ts[(head + mid) % cap] <= t:
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo
+
+    def drop_older_than(self, cutoff: int):
+        """Drop every point with a timestamp before cutoff.
+        
+        The expired points form a prefix, so its length is found by binary
+        search without touching each one.
+        """
+        n = self.first_newer(cutoff - 1)
+        if n:
+            self.head = (self.head + n) % self.capacity
+            self.size -= n
 
 # =====================================================================
 # MAIN OVERLAY WIDGET
@@ -405,6 +920,8 @@ class Overlay(QtWidgets.QWidget):
         
         # Configure window properties for overlay behavior
         self.setAttribute(QtCore.Qt.WA_TranslucentBackground, True)     # Enable transparency
+        self.setAttribute(QtCore.Qt.WA_NoSystemBackground, True)        # paintEvent clears its own dirty area
+        self.setAttribute(QtCore.Qt.WA_OpaquePaintEvent, False)         # ...but does not paint every pixel
         self.setAttribute(QtCore.Qt.WA_TransparentForMouseEvents, True) # Click-through
         self.setWindowFlag(QtCore.Qt.FramelessWindowHint, True)         # No title bar
         self.setWindowFlag(QtCore.Qt.WindowStaysOnTopHint, True)        # Always on top
@@ -414,13 +931,28 @@ class Overlay(QtWidgets.QWidget):
         vr = virtual_rect()
         self.setGeometry(vr.left(), vr.top(), vr.width(), vr.height())
         self.vr = vr  # Store for coordinate conversion
+        self._origin_x = vr.left()  # Subtracted from incoming samples so the
+        self._origin_y = vr.top()   # trail is stored in widget-local coordinates
 
         # Trail data storage
-        self.points: List[TrailPoint] = []  # All trail points
+        self.points = TrailBuffer(self._point_capacity())  # All trail points, oldest first
         self.stroke_id = 0                  # Current stroke identifier
-        self.prev_ctrl = False              # Previous CTRL key state
-        self._ema_xy: Optional[Tuple[float, float]] = None  # EMA smoothing state
+        self.prev_ctrl = False              # Previous CTRL key state (when polling)
+        self._ctrl = False                  # CTRL state from edge notifications
+        self._ema_x = 0.0                   # EMA smoothing state (X)
+        self._ema_y = 0.0                   # EMA smoothing state (Y)
+        self._ema_primed = False            # False until a stroke's first sample
+        self._last_x = float("inf")         # Last accepted point of the current stroke;
+        self._last_y = float("inf")         # infinite until one exists (always far enough)
         self.paused = False                 # Pause state
+        self._dirty = QtGui.QRegion()       # Widget area covered by the last repaint
+        self._strokes: List[Tuple[int, int, QtCore.QRect]] = []  # (lo, hi, bounds) per live stroke
+
+        # Monotonic clock for point timestamps; integer nanoseconds are immune
+        # to wall-clock adjustments and keep age comparisons in integer math
+        self._clock = QtCore.QElapsedTimer()
+        self._clock.start()
+        self._now = 0  # Clock reading of the current frame, sampled once in tick()
 
         # Initialize drawing pens for the core trail
         self.core_pen = QtGui.QPen(QtGui.QColor(*COLOR_START_RGB))
@@ -434,15 +966,73 @@ class Overlay(QtWidgets.QWidget):
         self.glow_pen.setCapStyle(QtCore.Qt.FlatCap)    # Flat ends for seamless joins
         self.glow_pen.setJoinStyle(QtCore.Qt.RoundJoin) # Smooth corners
 
+        # Prebuilt pen pair per age bucket, so painting a bucket is just a
+        # list lookup with no pen color changes
+        self._glow_pens: List[QtGui.QPen] = []
+        self._core_pens: List[QtGui.QPen] = []
+        for bucket in range(FADE_BUCKETS):
+            self._set_pens_for_age(self._bucket_age(bucket))
+            self._glow_pens.append(QtGui.QPen(self.glow_pen))
+            self._core_pens.append(QtGui.QPen(self.core_pen))
+
+        # Round cap images by color LUT step, rendered on first use
+        self._cap_sprites: List[Optional[QtGui.QImage]] = [None] * LUT_SIZE
+
         # Start the main update timer
         self.timer = QtCore.QTimer(self)
         self.timer.timeout.connect(self.tick)  # Connect to update function
         self.timer.start(FRAME_MS)             # ~60 FPS refresh rate
 
+        # When CTRL edges are reported, track CTRL from them instead of polling,
+        # and let the timer sleep while there is nothing to draw. Queued so the
+        # handler runs after the keyboard hook has returned to Windows.
+        edges = ctrl_edge_source()
+        self._ctrl_edges = edges is not None
+        if edges is not None:
+            self._ctrl = edges.ctrl_pressed
+            edges.ctrl_changed.connect(self._on_ctrl_changed, QtCore.Qt.QueuedConnection)
+
+    @staticmethod
+    def _point_capacity() -> int:
+        """Size the trail buffer for the most points that can be live at once.
+        
+        Polling adds at most one point per frame; the mouse hook can add one
+        per reported move. Twice the steady-state count leaves room for timer
+        jitter, and the oldest point is dropped if the buffer still fills up.
+        
+        Returns:
+            int: Ring buffer capacity in points
+        """
+        per_second = MAX_SAMPLE_HZ if hook_records_cursor() else 1000 / FRAME_MS
+        return int(FADE_SECONDS * per_second * 2)
+
     # ===================================================================
     # PUBLIC API
     # ===================================================================
     
+    def update_geometry(self):
+        """Resize the overlay to the current virtual desktop.
+        
+        Called when monitors are added, removed, moved or resized. Stored
+        points are widget-local, so they are shifted by the change in origin
+        and a trail already on screen stays where it was drawn.
+        """
+        vr = virtual_rect()
+        if vr == self.vr:
+            return
+        dx = self.vr.left() - vr.left()
+        dy = self.vr.top() - vr.top()
+        if dx or dy:
+            self.points.translate(dx, dy)
+            self._ema_x += dx; self._ema_y += dy
+            self._last_x += dx; self._last_y += dy
+        self.vr = vr
+        self._origin_x, self._origin_y = vr.left(), vr.top()
+        self.setGeometry(vr)
+        # The old dirty area is in the old coordinates; repaint everything once
+        self._dirty = QtGui.QRegion(self.rect())
+        self._refresh_strokes()
+
     def set_paused(self, p: bool):
         """Set the pause state of the trail drawing.
         
@@ -456,8 +1046,63 @@ class Overlay(QtWidgets.QWidget):
         if p:
             # Stop adding new points but let existing ones fade out
             pass
+        else:
+            # CTRL may already be held: don't join up with the stroke from
+            # before the pause. tick() idles the timer again if CTRL is up.
+            self._begin_stroke()
+            self.timer.start(FRAME_MS)
         self.paused_changed.emit(p)  # Notify listeners of state change
 
+    def _begin_stroke(self):
+        """Start a new stroke so the next point is not joined to the last one."""
+        self.stroke_id += 1         # Start new stroke
+        self._ema_primed = False    # Reset smoothing
+        self._last_x = self._last_y = float("inf")  # Accept the first point unconditionally
+
+    def _on_ctrl_changed(self, pressed: bool):
+        """Start and end strokes exactly on CTRL edges.
+        
+        A press begins a new stroke, installs the mouse hook for it and wakes
+        the frame timer. A release immediately adds the cursor moves recorded
+        before it, so the stroke ends where CTRL went up rather than at the
+        next frame, then removes the hook. tick() stops the timer once the
+        last points have faded (see _maybe_idle).
+        
+        Args:
+            pressed (bool): New CTRL state
+        """
+        self._ctrl = pressed
+        if pressed:
+            if self.paused:
+                return
+            start_cursor_sampling()
+            self._begin_stroke()
+            if not self.timer.isActive():
+                self.timer.start(FRAME_MS)
+        else:
+            samples = take_cursor_samples()
+            stop_cursor_sampling()
+            if samples and not self.paused:
+                self._add_samples(samples, self._clock.nsecsElapsed())
+                # Appending may have shifted a full buffer's head
+                self._refresh_strokes()
+
+    def _maybe_idle(self):
+        """Slow down or stop the frame timer when there is no trail to draw or fade.
+        
+        With CTRL edge notifications the timer simply stops until the next
+        press. Otherwise CTRL still has to be polled, so the timer drops to
+        IDLE_POLL_MS and returns to FRAME_MS as soon as a stroke begins.
+        """
+        pressed = self._ctrl if self._ctrl_edges else ctrl_down()
+        if self.points or (not self.paused and pressed):
+            if self.timer.interval() != FRAME_MS:
+                self.timer.setInterval(FRAME_MS)
+        elif self._ctrl_edges:
+            self.timer.stop()
+        elif self.timer.interval() != IDLE_POLL_MS:
+            self.timer.setInterval(IDLE_POLL_MS)
+
     # ===================================================================
     # MAIN UPDATE LOOP
     # ===================================================================
@@ -471,198 +1116,258 @@ class Overlay(QtWidgets.QWidget):
         - Point filtering and trail building
         - Automatic cleanup of old/faded points
         """
-        now = time.time()
+        now = self._now = self._clock.nsecsElapsed()
         
         if not self.paused:
-            # Check if CTRL key is currently pressed
-            pressed = ctrl_down()
-            
-            # Detect new stroke (CTRL just pressed)
-            if pressed and not self.prev_ctrl:
-                self.stroke_id += 1      # Start new stroke
-                self._ema_xy = None      # Reset smoothing
-
-            # Sample and smooth mouse position while CTRL is held
-            if pressed:
-                # Get raw mouse position
-                rx, ry = pyautogui.position()
-                
-                # Apply exponential moving average (EMA) smoothing
-                if self._ema_xy is None:
-                    # First point - no smoothing needed
-                    sx, sy = float(rx), float(ry)
-                else:
-                    # Smooth using EMA: new = α*raw + (1-α)*previous
-                    sx = EMA_ALPHA * float(rx) + (1.0 - EMA_ALPHA) * self._ema_xy[0]
-                    sy = EMA_ALPHA * float(ry) + (1.0 - EMA_ALPHA) * self._ema_xy[1]
+            if self._ctrl_edges:
+                # Catch a CTRL release the hook never saw (queues the edge)
+                if self._ctrl:
+                    recheck_ctrl_release()
+                # Maintained by _on_ctrl_changed, which also starts strokes
+                pressed = self._ctrl
+            else:
+                # Check if CTRL key is currently pressed
+                pressed = ctrl_down()
                 
-                self._ema_xy = (sx, sy)  # Store for next frame
-
-                # Apply minimum distance filter to reduce noise
-                accept = True
-                if self.points and self.points[-1].stroke == self.stroke_id:
-                    # Calculate distance from last point in current stroke
-                    dx = sx - self.points[-1].x
-                    dy = sy - self.points[-1].y
-                    distance_sq = dx*dx + dy*dy
-                    
-                    # Reject if too close to last point
-                    if distance_sq < (MIN_DIST_PX * MIN_DIST_PX):
-                        accept = False
+                # Detect new stroke (CTRL just pressed)
+                if pressed and not self.prev_ctrl:
+                    self._begin_stroke()
                 
-                # Add point if it passes distance filter
-                if accept:
-                    self.points.append(TrailPoint(int(sx), int(sy), now, self.stroke_id))
+                # Update previous CTRL state for next frame
+                self.prev_ctrl = pressed
+
+            # Cursor moves recorded by the mouse hook since the last frame
+            # (None when there is no hook and the cursor has to be polled)
+            samples = take_cursor_samples()
 
-            # Update previous CTRL state for next frame
-            self.prev_ctrl = pressed
+            # Sample and smooth mouse position while CTRL is held
+            if pressed:
+                if not samples:
+                    # Poll the raw mouse position (global screen coordinates);
+                    # also seeds a new stroke before the mouse has moved, and
+                    # keeps drawing if Windows has silently dropped the hook
+                    samples = (cursor_pos(),)
+                self._add_samples(samples, now)
+        else:
+            # Discard moves recorded while paused
+            take_cursor_samples()
 
         # Remove old points that have completely faded out
-        cutoff = now - FADE_SECONDS
-        if self.points and self.points[0].t < cutoff:
-            # Filter out points older than fade duration
-            self.points = [p for p in self.points if p.t >= cutoff]
+        self.points.drop_older_than(now - FADE_NS)
+
+        self._refresh_strokes()
 
-        # Trigger repaint
-        self.update()
+        # Go idle until the next CTRL press once everything has faded
+        self._maybe_idle()
+
+    def _refresh_strokes(self):
+        """Recompute the cached stroke ranges and schedule their repaint.
+        
+        The (lo, hi) ranges are logical indices into the ring buffer, so they
+        go stale whenever points are appended or dropped (a full buffer moves
+        its head on every append). Anything that changes the buffer has to
+        call this before the next paintEvent.
+        
+        Only the areas the strokes cover now plus what they covered last time
+        (so expired segments get erased) are repainted, not the whole virtual
+        desktop. Separate strokes get separate rectangles.
+        """
+        self._strokes = [(lo, hi, self._trail_bounds(lo, hi)) for lo, hi in self.points.stroke_ranges()]
+        dirty = QtGui.QRegion()
+        for _, _, rect in self._strokes:
+            dirty = dirty.united(rect)
+        region = dirty.united(self._dirty)
+        if not region.isEmpty():
+            self.update(region)
+        self._dirty = dirty
 
     # ===================================================================
     # COORDINATE AND CURVE UTILITIES  
     # ===================================================================
-    
-    def _to_local(self, x: float, y: float) -> Tuple[float, float]:
-        """Convert global screen coordinates to widget-local coordinates.
-        
-        Args:
-            x (float): Global screen X coordinate
-            y (float): Global screen Y coordinate
-            
-        Returns:
-            Tuple[float, float]: Local widget coordinates (x, y)
-        """
-        return x - self.vr.left(), y - self.vr.top()
 
-    def _catmull_rom_to_bezier(self, p0, p1, p2, p3, tension=CR_TENSION):
-        """Convert a Catmull-Rom spline segment to cubic Bézier control points.
+    def _add_samples(self, samples, now: int):
+        """Smooth raw cursor samples and add them to the current stroke.
+        
+        The smoothing state and the last accepted point are held in locals
+        for the whole batch and written back once, so each sample costs a
+        few float operations rather than a round of attribute lookups.
         
-        Catmull-Rom splines create smooth curves through points, but Qt only
-        supports Bézier curves. This function calculates the equivalent Bézier
-        control points for the segment from p1 to p2.
+        Samples are translated to widget-local coordinates here, once, so the
+        stored trail can be painted and bounded without any conversion.
         
         Args:
-            p0, p1, p2, p3 (QPointF): Four consecutive points
-            tension (float): Curve tension (1.0 = standard Catmull-Rom)
-            
-        Returns:
-            Tuple[QPointF, QPointF]: Control points (c1, c2) for Bézier curve
+            samples (Sequence[Tuple[int, int]]): Raw cursor positions
+                (global screen coordinates), oldest first
+            now (int): Timestamp for the resulting points (nanoseconds)
         """
-        # Calculate control points using Catmull-Rom to Bézier conversion
-        # c1 = p1 + (p2 - p0) * tension/6
-        c1 = QtCore.QPointF(p1.x() + (p2.x() - p0.x()) * (tension / 6.0),
-                            p1.y() + (p2.y() - p0.y()) * (tension / 6.0))
-        
-        # c2 = p2 - (p3 - p1) * tension/6  
-        c2 = QtCore.QPointF(p2.x() - (p3.x() - p1.x()) * (tension / 6.0),
-                            p2.y() - (p3.y() - p1.y()) * (tension / 6.0))
+        ox, oy = self._origin_x, self._origin_y
+        if not self._ema_primed:
+            if not samples:
+                return
+            # Seed the EMA with a new stroke's first sample; the first
+            # smoothing step then reproduces it exactly, so the loop needs
+            # no first-point branch
+            self._ema_x = float(samples[0][0] - ox)
+            self._ema_y = float(samples[0][1] - oy)
+            self._ema_primed = True
+        ex, ey = self._ema_x, self._ema_y
+        alpha = EMA_ALPHA
+        # Last point of the current stroke, for the minimum distance filter
+        last_x, last_y = self._last_x, self._last_y
         
-        return c1, c2
+        for rx, ry in samples:
+            # Apply exponential moving average (EMA) smoothing:
+            # new = previous + α*(raw - previous), i.e. α*raw + (1-α)*previous
+            ex += alpha * (rx - ox - ex)
+            ey += alpha * (ry - oy - ey)
+
+            # Apply minimum distance filter to reduce noise: squared distance
+            # from the last point in the current stroke (no sqrt; infinite
+            # before the stroke's first point)
+            dx = ex - last_x
+            dy = ey - last_y
+            
+            # Reject if too close to last point
+            if dx*dx + dy*dy < MIN_DIST_SQ:
+                continue
+            
+            # Add point since it passes distance filter
+            last_x, last_y = int(ex), int(ey)
+            self._append_point(last_x, last_y, now)
+
+        # Store for next batch
+        self._ema_x, self._ema_y = ex, ey
+        self._last_x, self._last_y = last_x, last_y
 
-    def _age_to_fade_and_color(self, age: float):
-        """Calculate fade amount and color based on trail point age.
+    def _append_point(self, x: int, y: int, t: int):
+        """Append a point to the current stroke and extend its curve geometry.
+        
+        Catmull-Rom control points only depend on a segment's neighbours, and
+        points are append-only within a stroke, so each new sample adds one
+        Bézier segment and finalizes the end tangent of the one before it:
         
-        Converts point age to both opacity (fade) and color along the
-        gradient from start color (orange) to end color (yellow).
+            c1 = p[i]   + (p[i+1] - p[i-1]) * tension/6
+            c2 = p[i+1] - (p[i+2] - p[i])   * tension/6
+        
+        Missing neighbours at either end of the stroke are duplicated. The
+        stored geometry never changes afterwards, so painting never has to
+        recompute it.
+        
+        Segments shorter than LINE_TO_CUTOFF_SQ are flagged as straight lines:
+        at a few pixels long a cubic looks identical to its chord, but Qt
+        still has to flatten it. Their control points sit on the endpoints so
+        the dirty bounds stay exact.
         
         Args:
-            age (float): Time since point was created (seconds)
-            
-        Returns:
-            Tuple[float, QColor]: (fade_factor, interpolated_color)
-                fade_factor: 0.0 (invisible) to 1.0 (fully opaque)
-                interpolated_color: Color between start and end colors
+            x (int): Widget-local X coordinate
+            y (int): Widget-local Y coordinate
+            t (int): Timestamp (nanoseconds)
         """
-        # Calculate normalized lifetime (0.0 = new, 1.0 = fully aged)
-        life = max(0.0, min(1.0, age / FADE_SECONDS))
-        
-        # Fade factor decreases as point ages
-        fade = 1.0 - life
+        pts = self.points
+        sid = self.stroke_id
+        prev = pts.slot(-1) if pts else -1
+        i = pts.append(x, y, t, sid)
+        pts.line[i] = 0
+        if prev >= 0 and pts.stroke[prev] == sid:
+            k = CR_K
+            X = pts.x; Y = pts.y
+            before = pts.slot(-3) if len(pts) >= 3 else prev
+            if pts.stroke[before] != sid:
+                before = prev
+            if before != prev and not pts.line[prev]:
+                # The previous segment's end tangent now has a real next point
+                pts.c2x[prev] = X[prev] - (x - X[before]) * k
+                pts.c2y[prev] = Y[prev] - (y - Y[before]) * k
+            dx = x - X[prev]; dy = y - Y[prev]
+            if dx*dx + dy*dy < LINE_TO_CUTOFF_SQ:
+                # Straight segment; c2 already sits on the point itself
+                pts.line[i] = 1
+                pts.c1x[i] = X[prev]
+                pts.c1y[i] = Y[prev]
+                return
+            pts.c1x[i] = X[prev] + (x - X[before]) * k
+            pts.c1y[i] = Y[prev] + (y - Y[before]) * k
+            pts.c2x[i] = x - dx * k
+            pts.c2y[i] = y - dy * k
+
+    def _trail_bounds(self, lo: int, hi: int) -> QtCore.QRect:
+        """Compute the widget-local rectangle covering a range of trail points.
         
-        # Interpolate color components from start to end
-        r0, g0, b0 = COLOR_START_RGB  # Orange (new)
-        r1, g1, b1 = COLOR_END_RGB    # Yellow (old)
+        Includes the Bézier control points (curves stay inside their hull)
+        and pads by DIRTY_MARGIN so the glow stroke and round caps fit.
         
-        r = int(r0 + (r1 - r0) * life)  # Red component
-        g = int(g0 + (g1 - g0) * life)  # Green component  
-        b = int(b0 + (b1 - b0) * life)  # Blue component
+        Args:
+            lo, hi (int): Logical index range of the points (hi exclusive, non-empty)
         
-        return fade, QtGui.QColor(r, g, b)
-
-    def _set_pens_for_age(self, painter: QtGui.QPainter, age: float):
+        Returns:
+            QRect: Area to repaint
+        """
+        points = self.points
+        xs = [s for arr in (points.x, points.c1x, points.c2x) for s in points.spans(arr, lo, hi)]
+        ys = [s for arr in (points.y, points.c1y, points.c2y) for s in points.spans(arr, lo, hi)]
+        left, top = min(map(min, xs)), min(map(min, ys))
+        right, bottom = max(map(max, xs)), max(map(max, ys))
+        m = DIRTY_MARGIN
+        return QtCore.QRect(QtCore.QPoint(int(left) - m, int(top) - m),
+                            QtCore.QPoint(int(right) + m + 1, int(bottom) + m + 1))
+
+    def _set_pens_for_age(self, age: int):
         """Configure drawing pens based on trail point age.
         
         Sets up both glow and core pens with appropriate colors and transparency
         based on how old the trail point is. Older points are more transparent.
+        Only the colors change; cap and join styles are fixed in __init__.
         
         Args:
-            painter (QPainter): Painter to configure
-            age (float): Age of the trail point in seconds
+            age (int): Age of the trail point in nanoseconds
         """
-        # Get fade amount and interpolated color
-        fade, col = self._age_to_fade_and_color(age)
-        
-        # Create glow pen with reduced opacity
-        glow_col = QtGui.QColor(col)
-        glow_col.setAlpha(int(fade * GLOW_ALPHA_MAX))
-        
-        # Create core pen with higher opacity
-        core_col = QtGui.QColor(col)
-        core_col.setAlpha(int(fade * CORE_ALPHA_MAX))
-        
-        # Apply colors to pens
-        self.glow_pen.setColor(glow_col)
-        self.core_pen.setColor(core_col)
+        # Look up precomputed colors (glow has reduced opacity, core higher)
+        idx = _lut_index(age)
+        self.glow_pen.setColor(_GLOW_LUT[idx])
+        self.core_pen.setColor(_CORE_LUT[idx])
+
+    @staticmethod
+    def _bucket_age(bucket: int) -> int:
+        """Representative age (nanoseconds) of a paint bucket: its midpoint."""
+        return (2 * bucket + 1) * FADE_NS // (2 * FADE_BUCKETS)
+
+    def _cap_sprite(self, idx: int) -> QtGui.QImage:
+        """Get the pre-rendered round cap image for one age step.
         
-        # Ensure flat caps for seamless joining
-        self.glow_pen.setCapStyle(QtCore.Qt.FlatCap)
-        self.core_pen.setCapStyle(QtCore.Qt.FlatCap)
-        
-        # Set glow pen as default (core pen applied separately)
-        painter.setPen(self.glow_pen)
-
-    def _draw_round_cap(self, painter: QtGui.QPainter, x: int, y: int, age: float):
-        """Draw a rounded end cap for a trail stroke.
-        
-        Creates circular caps at the beginning and end of each stroke to
-        give trails a more polished, rounded appearance.
+        Each sprite holds the glow and core discs of a cap, antialiased, in
+        the colors of LUT entry idx. Sprites are rendered on first use and
+        then reused, so drawing a cap is a single image blit. They use
+        Format_ARGB32_Premultiplied, the format of the translucent backing
+        store, so the raster engine blends them without converting pixels.
         
         Args:
-            painter (QPainter): Painter to draw with
-            x, y (int): Global screen coordinates of the cap center
-            age (float): Age of the trail point for fade/color calculation
+            idx (int): Color lookup table index (see _lut_index)
+            
+        Returns:
+            QImage: CAP_SPRITE_SIZE square sprite centered on the cap
         """
-        # Calculate fade and color based on age
-        fade, col = self._age_to_fade_and_color(age)
-        
-        # Skip if completely faded out
-        if fade <= 0.0:
-            return
+        sprite = self._cap_sprites[idx]
+        if sprite is None:
+            dpr = self.devicePixelRatioF()
+            sprite = QtGui.QImage(int(CAP_SPRITE_SIZE * dpr), int(CAP_SPRITE_SIZE * dpr),
+                                  QtGui.QImage.Format_ARGB32_Premultiplied)
+            sprite.setDevicePixelRatio(dpr)
+            sprite.fill(0)  # Fully transparent
+            
+            p = QtGui.QPainter(sprite)
+            p.setRenderHint(QtGui.QPainter.Antialiasing, True)  # Smooth edges
+            p.setPen(QtCore.Qt.NoPen)                           # No outline
+            center = QtCore.QPointF(CAP_SPRITE_SIZE / 2, CAP_SPRITE_SIZE / 2)
+            
+            # Glow circle (outer, softer), then core circle (inner, more opaque)
+            p.setBrush(_GLOW_LUT[idx])
+            p.drawEllipse(center, GLOW_WIDTH // 2, GLOW_WIDTH // 2)
+            p.setBrush(_CORE_LUT[idx])
+            p.drawEllipse(center, CORE_WIDTH // 2, CORE_WIDTH // 2)
+            p.end()
             
-        # Convert to local widget coordinates
-        lx, ly = self._to_local(x, y)
-        center = QtCore.QPointF(lx, ly)
-
-        # Draw glow circle (outer, softer)
-        glow = QtGui.QColor(col)
-        glow.setAlpha(int(fade * GLOW_ALPHA_MAX))
-        painter.setPen(QtCore.Qt.NoPen)              # No outline
-        painter.setBrush(QtGui.QBrush(glow))         # Solid fill
-        painter.drawEllipse(center, int(self.glow_pen.width()/2), int(self.glow_pen.width()/2))
-
-        # Draw core circle (inner, more opaque)
-        core = QtGui.QColor(col)
-        core.setAlpha(int(fade * CORE_ALPHA_MAX))
-        painter.setBrush(QtGui.QBrush(core))         # Solid fill
-        painter.drawEllipse(center, int(self.core_pen.width()/2), int(self.core_pen.width()/2))
+            self._cap_sprites[idx] = sprite
+        return sprite
 
     # ===================================================================
     # RENDERING
@@ -671,92 +1376,143 @@ class Overlay(QtWidgets.QWidget):
     def paintEvent(self, ev: QtGui.QPaintEvent):
         """Main rendering function called whenever the widget needs repainting.
         
-        Renders all trail segments using smooth Catmull-Rom curves converted
-        to cubic Bézier paths. Each segment is drawn twice (glow + core) with
-        age-based color and transparency.
+        Renders all trail segments as cubic Bézier paths using the Catmull-Rom
+        control points stored by _append_point. Segments are grouped into
+        FADE_BUCKETS age bins and each bin is accumulated into one QPainterPath,
+        so a frame costs two drawPath calls (glow + core) per bin instead of
+        two per segment.
         
         Args:
-            ev (QPaintEvent): Paint event (unused but required by Qt)
+            ev (QPaintEvent): Paint event; its region limits what gets painted
         """
+        # Initialize painter limited to the dirty area requested by tick(), and
+        # erase just that area (no system background is drawn for us)
+        painter = QtGui.QPainter(self)
+        painter.setClipRegion(ev.region())
+        painter.setCompositionMode(QtGui.QPainter.CompositionMode_Source)
+        painter.fillRect(ev.rect(), QtCore.Qt.transparent)
+        painter.setCompositionMode(QtGui.QPainter.CompositionMode_SourceOver)
+        
         # Skip rendering if no trail points exist
         if not self.points:
             return
             
-        # Initialize painter with antialiasing for smooth curves
-        painter = QtGui.QPainter(self)
-        painter.setRenderHint(QtGui.QPainter.Antialiasing, True)
-        now = time.time()
+        now = self._now  # Same frame time the trail was trimmed and bounded with
+        
+        # One path per age bucket; buckets with no segments stay None
+        paths: List[Optional[QtGui.QPainterPath]] = [None] * FADE_BUCKETS
+        caps: List[Tuple[int, float, float]] = []  # (LUT index, x, y) of round caps to draw
 
-        # Group points by stroke and render each stroke as a continuous curve
+        # Render each stroke (as split up by tick()) as a continuous curve,
+        # skipping strokes that lie entirely outside the area being repainted
+        clip = ev.region()
         pts = self.points
-        n = len(pts)
-        i = 0
+        X, Y, T = pts.x, pts.y, pts.t
+        C1X, C1Y, C2X, C2Y, L = pts.c1x, pts.c1y, pts.c2x, pts.c2y, pts.line
         
-        while i < n:
-            # Find all points belonging to the current stroke
-            j = i + 1
-            sid = pts[i].stroke  # Current stroke ID
+        for lo, hi, rect in self._strokes:
+            # Only render strokes with at least 2 points
+            if hi - lo < 2 or not clip.intersects(rect):
+                continue
             
-            # Advance j until we find a different stroke or reach the end
-            while j < n and pts[j].stroke == sid:
-                j += 1
+            # Segment j runs from point j-1 to point j and takes the age of
+            # point j. Ages only decrease along a stroke, so the fully faded
+            # segments form a prefix and each age bucket is one contiguous
+            # run; binary searches on the timestamps find the run boundaries
+            # instead of computing every segment's age.
+            j = pts.first_newer(now - FADE_NS, lo + 1, hi)
+            while j < hi:
+                bucket = max(0, now - T[pts.slot(j)]) * FADE_BUCKETS // FADE_NS
+                if bucket:
+                    # Youngest age still in this bucket: ceil(bucket * FADE_NS / FADE_BUCKETS)
+                    min_age = -(-bucket * FADE_NS // FADE_BUCKETS)
+                    end = pts.first_newer(now - min_age, j + 1, hi)
+                else:
+                    end = hi
                 
-            # Extract segment (all points with same stroke ID)
-            segment = pts[i:j]
+                # Append the run as one subpath of cubic Béziers (or lines) to
+                # this bucket's path. Each slot carries the control points of
+                # the segment ending at it. The plain-float overloads avoid
+                # building QPointF temporaries, so a segment costs a single
+                # call into Qt.
+                path = paths[bucket]
+                if path is None:
+                    path = paths[bucket] = QtGui.QPainterPath()
+                a = pts.slot(j - 1)
+                path.moveTo(X[a], Y[a])
+                for b in pts.slots(j, end):
+                    if L[b]:
+                        # Short segment: a cubic would be indistinguishable from the chord
+                        path.lineTo(X[b], Y[b])
+                    else:
+                        path.cubicTo(C1X[b], C1Y[b], C2X[b], C2Y[b], X[b], Y[b])
+                j = end
             
-            # Only render segments with at least 2 points
-            if len(segment) >= 2:
-                # Render smooth curves between consecutive points
-                for k in range(0, len(segment) - 1):
-                    # Get 4 points for Catmull-Rom curve calculation
-                    # Use duplicate points at ends if necessary
-                    p0 = segment[k-1] if k-1 >= 0 else segment[k]        # Previous point
-                    p1 = segment[k]                                       # Start point
-                    p2 = segment[k+1]                                     # End point  
-                    p3 = segment[k+2] if (k+2) < len(segment) else segment[k+1]  # Next point
-                    
-                    # Convert to local coordinates
-                    P0 = QtCore.QPointF(*self._to_local(p0.x, p0.y))
-                    P1 = QtCore.QPointF(*self._to_local(p1.x, p1.y))
-                    P2 = QtCore.QPointF(*self._to_local(p2.x, p2.y))
-                    P3 = QtCore.QPointF(*self._to_local(p3.x, p3.y))
-                    
-                    # Calculate Bézier control points from Catmull-Rom
-                    C1, C2 = self._catmull_rom_to_bezier(P0, P1, P2, P3)
-                    
-                    # Create cubic Bézier path from P1 to P2
-                    path = QtGui.QPainterPath(P1)
-                    path.cubicTo(C1, C2, P2)
-
-                    # Calculate age and skip if completely faded
-                    age = now - p2.t
-                    fade, _ = self._age_to_fade_and_color(age)
-                    if fade <= 0.0:
-                        continue
-                    
-                    # Configure pens for this age and draw the path
-                    self._set_pens_for_age(painter, age)
-                    
-                    # Draw glow effect (wider, more transparent)
-                    painter.setPen(self.glow_pen)
-                    painter.drawPath(path)
-                    
-                    # Draw core trail (narrower, more opaque)
-                    painter.setPen(self.core_pen)
-                    painter.drawPath(path)
-
-                # Add rounded end caps for a polished look
-                tail, head = segment[0], segment[-1]
-                self._draw_round_cap(painter, tail.x, tail.y, now - tail.t)
-                self._draw_round_cap(painter, head.x, head.y, now - head.t)
-                
-            # Move to next stroke
-            i = j
+            # Remember endpoints for rounded caps, unless completely faded
+            # out (the last LUT step has zero alpha)
+            for i in (pts.slot(lo), pts.slot(hi - 1)):
+                idx = _lut_index(now - T[i])
+                if idx < LUT_SIZE - 1:
+                    caps.append((idx, X[i], Y[i]))
+
+        # Draw glow effect (wider, more transparent) for every bucket first...
+        # The glow is soft and the core covers its middle, so its edges are
+        # rasterized without antialiasing
+        painter.setRenderHint(QtGui.QPainter.Antialiasing, False)
+        # strokePath takes the bucket's prebuilt pen directly, so there is no
+        # painter pen state to switch between buckets
+        glow_pens, core_pens = self._glow_pens, self._core_pens
+        for bucket, path in enumerate(paths):
+            if path is not None:
+                painter.strokePath(path, glow_pens[bucket])
+        
+        # ...then the core trail (narrower, more opaque) on top, antialiased
+        painter.setRenderHint(QtGui.QPainter.Antialiasing, True)
+        for bucket, path in enumerate(paths):
+            if path is not None:
+                painter.strokePath(path, core_pens[bucket])
+
+        # Add rounded end caps for a polished look: circular caps at the
+        # beginning and end of each stroke, blitted from the cached sprites
+        # in one pass with no pen or brush changes
+        half = CAP_SPRITE_SIZE / 2
+        for idx, x, y in caps:
+            painter.drawImage(QtCore.QPointF(x - half, y - half), self._cap_sprite(idx))
 
 # =====================================================================
 # SYSTEM TRAY INTEGRATION
 # =====================================================================
 
+@functools.lru_cache(maxsize=None)
+def _default_icon(active: bool = True) -> QtGui.QIcon:
+    """Create a simple default tray icon if no custom icon is available.
+    
+    Built on first use (a QApplication must exist) and cached for the
+    lifetime of the process, which also keeps the pixmap alive.
+    
+    Args:
+        active (bool): False for the greyed-out icon shown while paused
+    
+    Returns:
+        QIcon: A cyan (or grey) circle icon for the system tray
+    """
+    # Create transparent 64x64 pixmap
+    pm = QtGui.QPixmap(64, 64)
+    pm.fill(QtCore.Qt.transparent)
+    
+    # Draw a simple cyan circle
+    p = QtGui.QPainter(pm)
+    p.setRenderHint(QtGui.QPainter.Antialiasing, True)  # Smooth edges
+    
+    color = QtGui.QColor(0, 200, 255) if active else QtGui.QColor(128, 128, 128)  # Cyan or grey
+    pen = QtGui.QPen(color)
+    pen.setWidth(8)                              # Thick line
+    p.setPen(pen)
+    p.drawEllipse(8, 8, 48, 48)                  # Circle with 8px margin
+    p.end()
+    
+    return QtGui.QIcon(pm)
+
 class Tray(QtWidgets.QSystemTrayIcon):
     """System tray icon providing user control over the trail overlay.
     
@@ -774,8 +1530,11 @@ class Tray(QtWidgets.QSystemTrayIcon):
         super().__init__(parent)
         self.overlay = overlay
 
-        # Set tray icon (default Qt icon - replace with custom .ico if desired)
-        self.setIcon(self._default_icon())
+        # Active and paused tray icons are rendered once per process; pausing
+        # only swaps them (replace with custom .ico if desired)
+        self._icon_on = _default_icon(active=True)
+        self._icon_off = _default_icon(active=False)
+        self.setIcon(self._icon_off if overlay.paused else self._icon_on)
 
         # Create context menu
         menu = QtWidgets.QMenu()
@@ -796,33 +1555,14 @@ class Tray(QtWidgets.QSystemTrayIcon):
         quit_action = menu.addAction("Quit")
         quit_action.triggered.connect(QtWidgets.QApplication.quit)
 
+        # Keep icon and checkbox in sync with the overlay's pause state
+        overlay.paused_changed.connect(self._on_paused_changed)
+
         # Configure tray icon
         self.setContextMenu(menu)
         self.setToolTip(APP_NAME)  # Hover tooltip
         self.show()                # Make tray icon visible
 
-    def _default_icon(self):
-        """Create a simple default tray icon if no custom icon is available.
-        
-        Returns:
-            QIcon: A cyan circle icon for the system tray
-        """
-        # Create transparent 64x64 pixmap
-        pm = QtGui.QPixmap(64, 64)
-        pm.fill(QtCore.Qt.transparent)
-        
-        # Draw a simple cyan circle
-        p = QtGui.QPainter(pm)
-        p.setRenderHint(QtGui.QPainter.Antialiasing, True)  # Smooth edges
-        
-        pen = QtGui.QPen(QtGui.QColor(0, 200, 255))  # Cyan color
-        pen.setWidth(8)                              # Thick line
-        p.setPen(pen)
-        p.drawEllipse(8, 8, 48, 48)                  # Circle with 8px margin
-        p.end()
-        
-        return QtGui.QIcon(pm)
-
     def toggle_pause(self, checked):
         """Handle pause/resume toggle from tray menu.
         
@@ -831,6 +1571,15 @@ class Tray(QtWidgets.QSystemTrayIcon):
         """
         self.overlay.set_paused(checked)
 
+    def _on_paused_changed(self, paused: bool):
+        """Swap the prebuilt tray icon and sync the menu when pausing changes.
+        
+        Args:
+            paused (bool): New pause state of the overlay
+        """
+        self.setIcon(self._icon_off if paused else self._icon_on)
+        self.action_pause.setChecked(paused)
+
     def toggle_autorun(self, checked):
         """Handle auto-startup toggle from tray menu.
         
@@ -873,6 +1622,10 @@ def main():
     # Create and show the transparent overlay
     overlay = Overlay()
     overlay.show()
+
+    # Refresh the cached desktop geometry and resize the overlay when
+    # monitors are hotplugged
+    _watch_screen_changes(app, overlay.update_geometry)
     
     # Create system tray icon for user interaction
     tray = Tray(overlay)